@@ -5,7 +5,12 @@ This module handles the core game logic, including turn processing,
 score calculation, and game state management.
 """
 
-from player import PlayerType
+from collections import namedtuple
+import numpy as np
+from player import PlayerType, ComputerPlayer
+
+# Snapshot of the game statistics returned by GameLogic.get_player_stats
+Stats = namedtuple('Stats', 'round hider_score seeker_score hider_wins seeker_wins')
 
 class GameLogic:
     def __init__(self, world, hider, seeker):
@@ -16,13 +21,34 @@ class GameLogic:
         self.game_over = False
         self.hider_position = None
         self.seeker_position = None
-    
+        self.rng = np.random.default_rng()
+        # Computer players draw their moves from the game's shared generator
+        for player in (hider, seeker):
+            if isinstance(player, ComputerPlayer):
+                player.set_rng(self.rng)
+        # Scores and wins of (hider, seeker), shared with the players
+        self._scores = np.zeros(2)
+        self._wins = np.zeros(2, dtype=np.int64)
+        hider.bind_stats(self._scores[0:1], self._wins[0:1])
+        seeker.bind_stats(self._scores[1:2], self._wins[1:2])
+        self._update_score_signs()
+
+    def _update_score_signs(self):
+        """Cache the role-dependent score signs used on every round."""
+        # The payoff matrix is from the human's perspective, so the sign of
+        # each player's share of a round score only depends on the human's role
+        if self.world.human_choice == PlayerType.HIDER:
+            self._hider_sign, self._seeker_sign = 1, -1
+        else:
+            self._hider_sign, self._seeker_sign = -1, 1
+        self._score_signs = np.array([self._hider_sign, self._seeker_sign])
+
     def play_round(self):
         """
         Play a single round of the game.
         
         Returns:
-            tuple: (hider_pos, seeker_pos, score, found)
+            tuple: (hider_pos, seeker_pos, score, found) with flat position indices
         """
         # Get moves from both players
         hider_pos = self.hider.make_move(self.world)
@@ -32,35 +58,81 @@ class GameLogic:
         self.hider_position = hider_pos
         self.seeker_position = seeker_pos
         
-        # Calculate score
-        score = self.world.get_score(hider_pos, seeker_pos)
+        # Positions are flat indices, so the score is a direct lookup
+        score = float(self.world.payoff_matrix[hider_pos, seeker_pos])
         
         # Update player scores
         found = (hider_pos == seeker_pos)
 
-        if self.world.human_choice == PlayerType.HIDER:
-            # Score is from hider's perspective 
-            if found:
-                self.seeker.add_win()
-                self.seeker.add_score(-score)
-                self.hider.add_score(score)
-            else:
-                self.hider.add_win()
-                self.hider.add_score(score)
-                self.seeker.add_score(-score)
-        else:
-            # Score is from seeker's perspective 
-            if found:
-                self.seeker.add_win()
-                self.seeker.add_score(score)
-                self.hider.add_score(-score)
-            else:
-                self.hider.add_win()
-                self.hider.add_score(-score)
-                self.seeker.add_score(score)
+        self.hider.add_score(self._hider_sign * score)
+        self.seeker.add_score(self._seeker_sign * score)
+        self.seeker.wins += int(found)
+        self.hider.wins += 1 - int(found)
 
         self.round_number += 1
         return hider_pos, seeker_pos, score, found
+
+    def play_rounds(self, n):
+        """
+        Play n rounds at once between two computer players.
+
+        Both mixed strategies are fixed, so the moves are drawn in one batch
+        and the scores are looked up and summed with NumPy instead of calling
+        play_round n times.
+
+        Args:
+            n (int): Number of rounds to play
+
+        Returns:
+            tuple: (hider_idx, seeker_idx, scores, found) arrays of length n
+        """
+        payoff = self.world.get_payoff_matrix()
+        hider_p, seeker_p = self.get_mixed_strategies()
+        k = payoff.shape[0]
+
+        hider_idx = self.rng.choice(k, size=n, p=hider_p)
+        seeker_idx = self.rng.choice(k, size=n, p=seeker_p)
+        scores = payoff[hider_idx, seeker_idx]
+        found = hider_idx == seeker_idx
+
+        self.record_rounds(n, scores.sum(dtype=np.float64), int(np.count_nonzero(found)))
+
+        # Keep the last round visible to the UI
+        if n > 0:
+            self.hider_position = int(hider_idx[-1])
+            self.seeker_position = int(seeker_idx[-1])
+
+        return hider_idx, seeker_idx, scores, found
+
+    def get_mixed_strategies(self):
+        """
+        Get both computer players' strategies as normalized probability arrays.
+
+        Returns:
+            tuple: (hider_probabilities, seeker_probabilities) as np.ndarray
+        """
+        if not (isinstance(self.hider, ComputerPlayer) and isinstance(self.seeker, ComputerPlayer)):
+            raise ValueError("Batched rounds require two computer players")
+
+        k = self.world.size
+        hider_p = np.asarray(self.hider.strategy_probabilities, dtype=float)
+        seeker_p = np.asarray(self.seeker.strategy_probabilities, dtype=float)
+        if hider_p.size != k or seeker_p.size != k:
+            raise ValueError("Strategy probabilities not set or do not match world size")
+        return hider_p / hider_p.sum(), seeker_p / seeker_p.sum()
+
+    def record_rounds(self, n, total_score, seeker_wins):
+        """
+        Add the aggregated outcome of n rounds to the players' statistics.
+
+        Args:
+            n (int): Number of rounds played
+            total_score (float): Sum of the round scores
+            seeker_wins (int): Number of rounds where the seeker found the hider
+        """
+        self._scores += self._score_signs * total_score
+        self._wins += (n - seeker_wins, seeker_wins)
+        self.round_number += n
     
     def reset_game(self):
         """Reset the game state."""
@@ -76,15 +148,11 @@ class GameLogic:
         Get the current game statistics.
         
         Returns:
-            dict: Dictionary containing game statistics
+            Stats: Named tuple containing game statistics (use _asdict() for a dict)
         """
-        return {
-            'round': self.round_number,
-            'hider_score': self.hider.score,
-            'seeker_score': self.seeker.score,
-            'hider_wins': self.hider.wins,
-            'seeker_wins': self.seeker.wins
-        }
+        hider_score, seeker_score = self._scores.tolist()
+        hider_wins, seeker_wins = self._wins.tolist()
+        return Stats(self.round_number, hider_score, seeker_score, hider_wins, seeker_wins)
 
     def get_hider_position(self):
         return self.hider_position
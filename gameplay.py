@@ -5,20 +5,125 @@ This module contains gameplay-related methods for the Hide & Seek game UI.
 """
 
 from PyQt5.QtWidgets import QMessageBox, QLabel
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
 
 from player import PlayerType, HumanPlayer, ComputerPlayer
 from world import World1D, World2D
 from game_logic import GameLogic
 from lp_solver import LPSolver
 from simulation import Simulation
-import numpy as np
+
+# Role played by the computer for each role the human can choose
+OPPONENT_ROLE = {PlayerType.HIDER: PlayerType.SEEKER, PlayerType.SEEKER: PlayerType.HIDER}
+
+# Rounds played by one click on "Fast Forward"
+FAST_FORWARD_ROUNDS = 10000
+# Rounds played per refresh while fast-forwarding
+SIM_BATCH_ROUNDS = 500
+# Refresh interval of the stats labels while fast-forwarding (~30 Hz)
+SIM_REFRESH_MS = 33
+
+# Style of the message boxes, in the game's color scheme
+MESSAGE_BOX_STYLE = """
+    QMessageBox {
+        background-color: #121212;
+        color: #e0e0e0;
+    }
+    QPushButton {
+        background-color: #1e88e5;
+        color: white;
+        min-width: 80px;
+        border-radius: 4px;
+        padding: 5px;
+        font-weight: bold;
+    }
+    QLabel {
+        color: #e0e0e0;
+    }
+"""
+
+# Status messages shown after each round; positions are ints in a 1D world
+# and (row, col) tuples in a 2D world
+ROUND_MESSAGE = ("Round {round_num} results:\n"
+                 "Human ({human_role}) played position {human_move}\n"
+                 "Computer ({computer_role}) played position {computer_move}\n"
+                 "Outcome: {outcome}\n"
+                 "Score: {score}\n\n"
+                 "Check the Strategy Visualization tab to see computer probabilities.")
+SIM_ROUND_MESSAGE = ("Round {rounds_played} results:\n"
+                     "Hider played position {hider_pos}\n"
+                     "Seeker played position {seeker_pos}\n"
+                     "Outcome: {outcome}\n"
+                     "Payoff: {payoff}\n\n"
+                     "Hider win rate: {hider_win_rate:.2f}%\n"
+                     "Seeker win rate: {seeker_win_rate:.2f}%\n\n"
+                     "Check the Strategy Visualization tab to see both players' strategies.")
+
+class SimulationWorker(QThread):
+    """Plays simulation rounds in batches off the UI thread."""
+    
+    progress = pyqtSignal(int, dict)
+    finished_sig = pyqtSignal(dict)
+    
+    def __init__(self, simulation, num_rounds, batch_size, parent=None):
+        """
+        Initialize the worker.
+        
+        Args:
+            simulation (Simulation): Simulation to advance
+            num_rounds (int): Total number of rounds to play
+            batch_size (int): Rounds played between progress signals
+            parent (QObject): Parent object
+        """
+        super().__init__(parent)
+        self.simulation = simulation
+        self.num_rounds = num_rounds
+        self.batch_size = batch_size
+    
+    def run(self):
+        """Play the rounds, emitting the running results after each batch."""
+        rounds_left = self.num_rounds
+        stats = self.simulation.get_results()
+        while rounds_left > 0 and not self.isInterruptionRequested():
+            batch = min(self.batch_size, rounds_left)
+            stats = self.simulation.advance(batch)
+            rounds_left -= batch
+            self.progress.emit(self.num_rounds - rounds_left, stats)
+        self.finished_sig.emit(stats)
+
+class StrategyWorker(QThread):
+    """Solves a player's optimal strategy off the UI thread."""
+    
+    solved = pyqtSignal(object)
+    
+    def __init__(self, world, player_type, lp_solver, parent=None):
+        """
+        Initialize the worker.
+        
+        Args:
+            world (BaseWorld): World whose payoff matrix is solved
+            player_type (PlayerType): Role to solve the strategy for
+            lp_solver (LPSolver): Solver to use
+            parent (QObject): Parent object
+        """
+        super().__init__(parent)
+        self.world = world
+        self.player_type = player_type
+        self.lp_solver = lp_solver
+    
+    def run(self):
+        """Solve the strategy and emit it."""
+        self.solved.emit(self.world.get_strategy(self.player_type, self.lp_solver))
 
 class GamePlay:
     """Handles gameplay methods for the Hide & Seek game UI."""
     
     def initialize_game(self):
         """Initialize the game with the selected parameters."""
+        # A new game replaces a running simulation
+        if getattr(self, 'simulation_active', False):
+            self.end_simulation_mode()
+        
         world_size = self.world_size_spin.value()
         player_type = PlayerType(self.player_type_group.checkedId())
         world_dimension = self.world_dim_group.checkedId()
@@ -36,33 +141,12 @@ class GamePlay:
         if hasattr(self, 'selected_position'):
             self.selected_position = None
 
-        payoff_matrix_np = np.array(self.world.get_payoff_matrix())
-
-        # Initialize players
-        if player_type == PlayerType.HIDER:
-            self.human_player = HumanPlayer(PlayerType.HIDER)
-            self.computer_player = ComputerPlayer(PlayerType.SEEKER)
-
-            strategy = self.lp_solver.solve_game(payoff_matrix_np, PlayerType.SEEKER)
-            self.computer_player.set_strategy(strategy)
-            
-            # Create game logic
-            self.game_logic = GameLogic(self.world, self.human_player, self.computer_player)
-        else:
-            self.human_player = HumanPlayer(PlayerType.SEEKER)
-            self.computer_player = ComputerPlayer(PlayerType.HIDER)
-            
-
-            strategy = self.lp_solver.solve_game(payoff_matrix_np, PlayerType.HIDER)
-            self.computer_player.set_strategy(strategy)
-            
-            # Create game logic
-            self.game_logic = GameLogic(self.world, self.computer_player, self.human_player)
+        # Initialize players and game logic
+        self.setup_players(player_type)
         
-        # Update UI
+        # Update UI, the payoff tab is filled once the game board has been painted
         self.update_world_grid()
-        self.update_payoff_matrix()
-        self.update_probability_visualization()
+        QTimer.singleShot(0, self.update_payoff_matrix)
         
         # Switch to the game board tab after initialization
         self.tab_widget.setCurrentIndex(0)
@@ -71,19 +155,88 @@ class GamePlay:
         self.play_btn.setEnabled(False)  # Disabled until player makes a move
         self.reset_btn.setEnabled(True)
         
-        # Show strategy explanation
-        self.show_status_message(f"Game initialized. You are playing as {player_type.name}.\nClick on a position in the grid to make a move.\nCheck the Strategy Visualization tab to see computer probabilities.")
+        # Show strategy explanation once the computer's strategy is known
+        self.request_strategy(f"Game initialized. You are playing as {player_type.name}.\nClick on a position in the grid to make a move.\nCheck the Strategy Visualization tab to see computer probabilities.")
+    
+    def setup_players(self, human_role):
+        """
+        Create the human and computer players and the game logic for the current world.
+        
+        Args:
+            human_role (PlayerType): Role chosen by the human player
+        """
+        computer_role = OPPONENT_ROLE[human_role]
+        self.human_player = HumanPlayer(human_role)
+        # The strategy is set by request_strategy
+        self.computer_player = ComputerPlayer(computer_role)
+        
+        # GameLogic takes the players in (hider, seeker) order
+        if human_role == PlayerType.HIDER:
+            hider, seeker = self.human_player, self.computer_player
+        else:
+            hider, seeker = self.computer_player, self.human_player
+        self.game_logic = GameLogic(self.world, hider, seeker)
+    
+    def request_strategy(self, ready_message):
+        """
+        Solve the computer's strategy in a worker thread.
+        
+        The grid stays disabled until the strategy is set, so no round can
+        be played without it. A strategy already solved for this world is
+        set right away.
+        
+        Args:
+            ready_message (str): Status message shown once the strategy is set
+        """
+        self.strategy_ready_message = ready_message
+        # A solve still running for a previous world is dropped
+        self.strategy_worker = None
+        computer_role = self.computer_player.type
+        if computer_role in self.world.strategies:
+            self.apply_computer_strategy(self.world.strategies[computer_role])
+            return
+        
+        self.world_grid.parentWidget().setEnabled(False)
+        self.show_status_message("Computing the computer's strategy...")
+        self.strategy_worker = StrategyWorker(self.world, computer_role, self.lp_solver, self)
+        self.strategy_worker.solved.connect(self.on_strategy_solved)
+        self.strategy_worker.finished.connect(self.strategy_worker.deleteLater)
+        self.strategy_worker.start()
+    
+    def on_strategy_solved(self, strategy):
+        """Set the strategy solved by the current worker, ignoring stale ones."""
+        if self.sender() is not self.strategy_worker:
+            return
+        self.strategy_worker = None
+        self.apply_computer_strategy(strategy)
+    
+    def apply_computer_strategy(self, strategy):
+        """
+        Give the computer player its strategy and enable the grid.
+        
+        Args:
+            strategy (np.ndarray): Probability distribution over positions
+        """
+        if getattr(self, 'simulation_active', False):
+            return
+        self.computer_player.set_strategy(strategy)
+        self.world_grid.parentWidget().setEnabled(True)
+        self.show_status_message(self.strategy_ready_message)
+        QTimer.singleShot(0, self.update_probability_visualization)
     
     def handle_button_click(self, position):
         """Handle a button click on the grid."""
         if not self.game_logic:
             return
+        # The simulation worker owns the game logic while it runs
+        if self.sim_worker is not None and self.sim_worker.isRunning():
+            return
             
-        # Reset all buttons to their base style first
-        self.reset_all_buttons_to_base_style()
+        # Reset the previously highlighted buttons to their base style first
+        self.reset_marked_buttons()
         
         # Set the human player's move
-        self.human_player.set_move(position)
+        self.human_player.set_move(self.world.pos_to_index(position))
         
         # Enable play button to execute the round
         self.play_btn.setEnabled(True)
@@ -119,8 +272,9 @@ class GamePlay:
         else:
             computer_move = hider_pos
         
-        # Update UI with the result
-        self.update_game_ui(result, self.human_player.move, computer_move)
+        # Update UI with the result, converting the flat indices back to positions
+        self.update_game_ui(result, self.world.index_to_pos(self.human_player.move),
+                            self.world.index_to_pos(computer_move))
         
         # Update statistics
         self.update_stats()
@@ -133,43 +287,24 @@ class GamePlay:
     
     def update_game_ui(self, result, human_move, computer_move):
         """Update the UI with the result of the round."""
-        # Update result label
+        # Update round number and result
         hider_pos, seeker_pos, score, found = result
-        self.result_label.setText(f"Result: {'Seeker found Hider' if found else 'Hider escaped'}")
-        
-        # Update round number
-        round_num = int(self.round_label.text().split(':')[-1].strip()) + 1
-        self.round_label.setText(f"Round: {round_num}")
+        round_num = self.info_round + 1
+        outcome = 'Seeker found Hider' if found else 'Hider escaped'
+        self.show_game_info(round_num, outcome)
         
         # Show results in status message
-        human_role = self.human_player.type.name
-        computer_role = self.computer_player.type.name
-        
-        if isinstance(self.world, World1D):
-            msg = f"Round {round_num} results:\n"
-            msg += f"Human ({human_role}) played position {human_move}\n"
-            msg += f"Computer ({computer_role}) played position {computer_move}\n"
-            msg += f"Outcome: {'Seeker found Hider' if found else 'Hider escaped'}\n"
-            msg += f"Score: {score}\n\n"
-            msg += "Check the Strategy Visualization tab to see computer probabilities."
-        else:  # 2D world
-            h_row, h_col = human_move
-            c_row, c_col = computer_move
-            msg = f"Round {round_num} results:\n"
-            msg += f"Human ({human_role}) played position ({h_row}, {h_col})\n"
-            msg += f"Computer ({computer_role}) played position ({c_row}, {c_col})\n"
-            msg += f"Outcome: {'Seeker found Hider' if found else 'Hider escaped'}\n"
-            msg += f"Score: {score}\n\n"
-            msg += "Check the Strategy Visualization tab to see computer probabilities."
-            
-        # Update status message
+        msg = ROUND_MESSAGE.format(round_num=round_num, human_role=self.human_player.type.name,
+                                   human_move=human_move, computer_role=self.computer_player.type.name,
+                                   computer_move=computer_move, outcome=outcome, score=score)
         self.show_status_message(msg)
         
         # Update visuals
         self.highlight_positions()
         
-        # Update the strategy visualization as the computer's strategy may have changed
-        self.update_probability_visualization()
+        # The strategy only changes with the world, so this is a no-op unless
+        # the view does not show the current one
+        QTimer.singleShot(0, self.update_probability_visualization)
     
     def reset_game(self):
         """Reset the game."""
@@ -185,41 +320,22 @@ class GamePlay:
         elif isinstance(self.world, World2D):
             self.world = World2D(self.world.rows, self.world.cols, human_choice=player_type, use_proximity=True)
             
-        # Reset players
-        if player_type == PlayerType.HIDER:
-            self.human_player = HumanPlayer(PlayerType.HIDER)
-            self.computer_player = ComputerPlayer(PlayerType.SEEKER)
-        else:
-            self.human_player = HumanPlayer(PlayerType.SEEKER)
-            self.computer_player = ComputerPlayer(PlayerType.HIDER)
-            
-        # Set computer strategy
-        payoff_matrix = self.world.get_payoff_matrix()
-
-        strategy = self.lp_solver.solve_game(payoff_matrix, self.computer_player.type)
-        self.computer_player.set_strategy(strategy)
-        
-        # Reset game logic
-        if player_type == PlayerType.HIDER:
-            self.game_logic = GameLogic(self.world, self.human_player, self.computer_player)
-        else:
-            self.game_logic = GameLogic(self.world, self.computer_player, self.human_player)
+        # Reset players and game logic
+        self.setup_players(player_type)
         
-        # Reset UI
+        # Reset UI, the payoff tab is filled once the game board has been painted
         self.update_world_grid()
-        self.update_payoff_matrix()
-        self.update_probability_visualization()
+        QTimer.singleShot(0, self.update_payoff_matrix)
         
         # Reset play button state
         self.play_btn.setEnabled(False)
         
         # Reset stats
-        self.human_score_label.setText("Score: 0")
-        self.human_wins_label.setText("Wins: 0")
-        self.computer_score_label.setText("Score: 0")
-        self.computer_wins_label.setText("Wins: 0")
-        self.round_label.setText("Round: 0")
-        self.result_label.setText("Result: -")
+        self.show_player_stats()
+        self.show_game_info(0, "-")
+        
+        # Solve the new world's strategy, keeping the current status message
+        self.request_strategy(self.status_label.text())
     
     def run_simulation(self):
         """Initialize and prepare a step-by-step simulation."""
@@ -227,23 +343,19 @@ class GamePlay:
         world_dimension = self.world_dim_group.checkedId()
         world_size = self.world_size_spin.value()
         player_type = PlayerType(self.player_type_group.checkedId())
+        self.stop_simulation_worker()
+        # The simulation solves its own strategies, a pending game solve is dropped
+        self.strategy_worker = None
         
         # Clear the world grid and reset visualization
         self.reset_all_buttons_to_base_style()
         
         # Clear probability visualization
-        for i in reversed(range(self.probability_grid.count())):
-            item = self.probability_grid.itemAt(i)
-            if item.widget():
-                item.widget().deleteLater()
+        self.clear_probability_grid()
         
         # Reset stats display
-        self.human_score_label.setText("Score: 0")
-        self.human_wins_label.setText("Wins: 0")
-        self.computer_score_label.setText("Score: 0")
-        self.computer_wins_label.setText("Wins: 0")
-        self.round_label.setText("Round: 0")
-        self.result_label.setText("Result: -")
+        self.show_player_stats()
+        self.show_game_info(0, "-")
         
         # # Create appropriate world
         # if world_dimension == 1:
@@ -253,6 +365,7 @@ class GamePlay:
             
         # Create the simulation
         self.simulation = Simulation(self.world)
+        self.sim_probability_view = None
         self.simulation_active = True
         
         # Reset game_logic to ensure no positions are displayed
@@ -270,12 +383,7 @@ class GamePlay:
         # Make sure the payoff matrix is displayed
         self.update_payoff_matrix()
         
-        # Switch to each tab once to ensure they're all properly rendered
-        for i in range(self.tab_widget.count()):
-            self.tab_widget.setCurrentIndex(i)
-            # A small delay could be added here if needed
-            
-        # Switch back to the game board tab
+        # Switch back to the game board tab, the others are painted when opened
         self.tab_widget.setCurrentIndex(0)
         
         # Show status message
@@ -295,6 +403,8 @@ class GamePlay:
         self.seeker_player = self.simulation.seeker
         
         # Set up buttons for the simulation
+        self.fast_forward_btn.setVisible(True)
+        self.fast_forward_btn.setEnabled(True)
         self.play_btn.setText("Next Round")
         self.play_btn.setEnabled(True)
         self.play_btn.clicked.disconnect()  # Disconnect existing connections
@@ -306,12 +416,8 @@ class GamePlay:
         self.reset_btn.clicked.connect(self.stop_simulation)
         
         # Initialize stats display
-        self.human_score_label.setText("Hider Score: 0")
-        self.human_wins_label.setText("Hider Wins: 0") 
-        self.computer_score_label.setText("Seeker Score: 0")
-        self.computer_wins_label.setText("Seeker Wins: 0")
-        self.round_label.setText("Round: 0")
-        self.result_label.setText("Simulation Started")
+        self.show_player_stats(prefixes=("Hider ", "Seeker "))
+        self.show_game_info(0, "Simulation Started")
     
     def play_simulation_round(self):
         """Play one round of the simulation."""
@@ -321,20 +427,18 @@ class GamePlay:
         # Play one round
         results = self.simulation.next_round()
         hider_pos, seeker_pos, payoff, found, stats = results
+        hider_pos = self.world.index_to_pos(hider_pos)
+        seeker_pos = self.world.index_to_pos(seeker_pos)
         
         # Update the world to show positions
         self.game_logic = self.simulation.game_logic
         
         # Update stats display
-        self.human_score_label.setText(f"Hider Score: {self.simulation.hider.score}")
-        self.human_wins_label.setText(f"Hider Wins: {stats['hider_wins']}")
-        self.computer_score_label.setText(f"Seeker Score: {self.simulation.seeker.score}")
-        self.computer_wins_label.setText(f"Seeker Wins: {stats['seeker_wins']}")
-        self.round_label.setText(f"Round: {stats['rounds_played']}")
+        self.show_simulation_stats(stats)
         
         # Update result
         result_text = "Seeker found Hider!" if found else "Hider escaped!"
-        self.result_label.setText(f"Result: {result_text}")
+        self.show_game_info(result=result_text)
         
         # Show positions on grid
         self.highlight_positions()
@@ -343,38 +447,100 @@ class GamePlay:
         self.update_simulation_probability_visualization()
         
         # Show status message with details
-        if isinstance(self.world, World1D):
-            msg = f"Round {stats['rounds_played']} results:\n"
-            msg += f"Hider played position {hider_pos}\n"
-            msg += f"Seeker played position {seeker_pos}\n"
-            msg += f"Outcome: {result_text}\n"
-            msg += f"Payoff: {payoff}\n\n"
-            msg += f"Hider win rate: {stats['hider_win_rate']:.2f}%\n"
-            msg += f"Seeker win rate: {stats['seeker_win_rate']:.2f}%\n\n"
-            msg += "Check the Strategy Visualization tab to see both players' strategies."
-        else:  # 2D world
-            h_row, h_col = hider_pos
-            s_row, s_col = seeker_pos
-            msg = f"Round {stats['rounds_played']} results:\n"
-            msg += f"Hider played position ({h_row}, {h_col})\n"
-            msg += f"Seeker played position ({s_row}, {s_col})\n"
-            msg += f"Outcome: {result_text}\n"
-            msg += f"Payoff: {payoff}\n\n"
-            msg += f"Hider win rate: {stats['hider_win_rate']:.2f}%\n"
-            msg += f"Seeker win rate: {stats['seeker_win_rate']:.2f}%\n\n"
-            msg += "Check the Strategy Visualization tab to see both players' strategies."
+        self.show_status_message(SIM_ROUND_MESSAGE.format(hider_pos=hider_pos, seeker_pos=seeker_pos,
+                                                          outcome=result_text, payoff=payoff, **stats))
         
-        self.show_status_message(msg)
+    def show_simulation_stats(self, stats):
+        """Show the running simulation statistics in the stats labels.
         
-    def stop_simulation(self):
-        """Stop the step-by-step simulation and show results."""
-        if not hasattr(self, 'simulation'):
+        Args:
+            stats (dict): Simulation results from Simulation.get_results()
+        """
+        self.show_player_stats((stats['hider_score'], stats['seeker_score']),
+                               (stats['hider_wins'], stats['seeker_wins']), ("Hider ", "Seeker "))
+        self.show_game_info(round_num=stats['rounds_played'])
+    
+    def fast_forward_simulation(self):
+        """Play many simulation rounds in a worker thread without updating the UI every round."""
+        if not hasattr(self, 'simulation') or not self.simulation_active:
             return
-            
-        self.simulation_active = False
         
-        # Get final results
-        results = self.simulation.get_results()
+        self.play_btn.setEnabled(False)
+        self.fast_forward_btn.setEnabled(False)
+        # Nothing else may touch the simulation until the worker is done
+        self.sim_locked_widgets = [widget for widget in (self.world_grid.parentWidget(), self.init_game_btn, self.sim_game_btn)
+                                   if widget.isEnabled()]
+        for widget in self.sim_locked_widgets:
+            widget.setEnabled(False)
+        self.game_logic = self.simulation.game_logic
+        self.sim_snapshot = None
+        
+        self.sim_worker = SimulationWorker(self.simulation, FAST_FORWARD_ROUNDS, SIM_BATCH_ROUNDS, self)
+        self.sim_worker.progress.connect(self.on_simulation_progress)
+        self.sim_worker.finished_sig.connect(self.on_simulation_done)
+        
+        # The labels are refreshed from the latest snapshot at a fixed rate
+        self.sim_timer.start(SIM_REFRESH_MS)
+        self.sim_worker.start()
+    
+    def on_simulation_progress(self, rounds_done, stats):
+        """Keep the latest results reported by the simulation worker."""
+        if self.sender() is not self.sim_worker:
+            return
+        self.sim_snapshot = stats
+    
+    def flush_simulation_stats(self):
+        """Push the latest simulation snapshot to the stats labels."""
+        if self.sim_snapshot is not None:
+            self.show_simulation_stats(self.sim_snapshot)
+            self.sim_snapshot = None
+    
+    def on_simulation_done(self, stats):
+        """Show the results once the simulation worker has finished, ignoring stopped ones."""
+        if self.sender() is not self.sim_worker:
+            return
+        self.sim_timer.stop()
+        self.sim_snapshot = None
+        self.unlock_simulation_widgets()
+        if not self.simulation_active:
+            return
+        
+        self.show_simulation_stats(stats)
+        self.play_btn.setEnabled(True)
+        self.fast_forward_btn.setEnabled(True)
+        
+        # Show the last round on the grid
+        self.show_game_info(result=f"{FAST_FORWARD_ROUNDS} rounds played")
+        self.highlight_positions()
+        
+        msg = f"Played {FAST_FORWARD_ROUNDS} rounds.\n"
+        msg += f"Rounds played: {stats['rounds_played']}\n\n"
+        msg += f"Hider win rate: {stats['hider_win_rate']:.2f}%\n"
+        msg += f"Seeker win rate: {stats['seeker_win_rate']:.2f}%\n"
+        msg += f"Average Payoff: {stats['avg_payoff']:.2f}"
+        self.show_status_message(msg)
+    
+    def stop_simulation_worker(self):
+        """Interrupt a running fast-forward and wait for it, dropping its pending signals."""
+        self.sim_timer.stop()
+        self.sim_snapshot = None
+        worker, self.sim_worker = self.sim_worker, None
+        if worker is not None and worker.isRunning():
+            worker.requestInterruption()
+            worker.wait()
+        self.unlock_simulation_widgets()
+    
+    def unlock_simulation_widgets(self):
+        """Re-enable the widgets disabled for a fast-forward."""
+        for widget in self.sim_locked_widgets:
+            widget.setEnabled(True)
+        self.sim_locked_widgets = []
+    
+    def end_simulation_mode(self):
+        """Stop the simulation's worker and give the controls back to the game."""
+        self.simulation_active = False
+        self.stop_simulation_worker()
+        self.fast_forward_btn.setVisible(False)
         
         # Restore buttons
         self.play_btn.setText("Play Round")
@@ -385,23 +551,26 @@ class GamePlay:
         self.reset_btn.setText("Reset Game")
         self.reset_btn.clicked.disconnect()
         self.reset_btn.clicked.connect(self.reset_game)
+    
+    def stop_simulation(self):
+        """Stop the step-by-step simulation and show results."""
+        if not hasattr(self, 'simulation'):
+            return
+            
+        self.end_simulation_mode()
+        
+        # Get final results
+        results = self.simulation.get_results()
         
         # Clear the world grid and reset visualization
         self.reset_all_buttons_to_base_style()
         
         # Clear probability visualization
-        for i in reversed(range(self.probability_grid.count())):
-            item = self.probability_grid.itemAt(i)
-            if item.widget():
-                item.widget().deleteLater()
+        self.clear_probability_grid()
         
         # Reset stats display
-        self.human_score_label.setText("Score: 0")
-        self.human_wins_label.setText("Wins: 0")
-        self.computer_score_label.setText("Score: 0")
-        self.computer_wins_label.setText("Wins: 0")
-        self.round_label.setText("Round: 0")
-        self.result_label.setText("Result: -")
+        self.show_player_stats()
+        self.show_game_info(0, "-")
         
         # Show final results
         msg = "Simulation Results:\n\n"
@@ -417,47 +586,48 @@ class GamePlay:
         if not self.game_logic:
             return
             
-        # Update score labels
-        human_score = self.human_player.score
-        computer_score = self.computer_player.score
-        
-        self.human_score_label.setText(f"Score: {human_score}")
-        self.computer_score_label.setText(f"Score: {computer_score}")
+        # Update scores and win counts
+        self.show_player_stats((self.human_player.score, self.computer_player.score),
+                               (self.human_player.wins, self.computer_player.wins))
+    
+    def show_player_stats(self, scores=(0, 0), wins=(0, 0), prefixes=("", "")):
+        """
+        Show the scores and wins of both players.
         
-        # Update win counts
-        human_wins = self.human_player.wins
-        computer_wins = self.computer_player.wins
+        Args:
+            scores (tuple): Scores of the (human, computer), or (hider, seeker) in a simulation
+            wins (tuple): Wins in the same order
+            prefixes (tuple): Prefixes of the score and wins lines, e.g. ("Hider ", "Seeker ")
+        """
+        columns = ((self.human_stats_label, "Human Player:"), (self.computer_stats_label, "Computer Player:"))
+        for (label, title), prefix, score, win in zip(columns, prefixes, scores, wins):
+            label.setText(f"{title}\n{prefix}Score: {score}\n{prefix}Wins: {win}")
+    
+    def show_game_info(self, round_num=None, result=None):
+        """
+        Show the round number and the last result, keeping the one not given.
         
-        self.human_wins_label.setText(f"Wins: {human_wins}")
-        self.computer_wins_label.setText(f"Wins: {computer_wins}")
+        Args:
+            round_num (int): Round number
+            result (str): Result of the last round
+        """
+        if round_num is not None:
+            self.info_round = round_num
+        if result is not None:
+            self.info_result = result
+        self.game_info_label.setText(f"Game Info:\nRound: {self.info_round}\nResult: {self.info_result}")
     
     def show_styled_message_box(self, title, message):
         """Show a styled message box with the game's color scheme."""
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle(title)
-        msg_box.setText(message)
-        msg_box.setIcon(QMessageBox.Information)
-        
-        # Style the message box
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: #121212;
-                color: #e0e0e0;
-            }
-            QPushButton {
-                background-color: #1e88e5;
-                color: white;
-                min-width: 80px;
-                border-radius: 4px;
-                padding: 5px;
-                font-weight: bold;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-        """)
-        
-        msg_box.exec_()
+        # The box is created and styled once, then reused for every message
+        if self.message_box is None:
+            self.message_box = QMessageBox(self)
+            self.message_box.setIcon(QMessageBox.Information)
+            self.message_box.setStyleSheet(MESSAGE_BOX_STYLE)
+        
+        self.message_box.setWindowTitle(title)
+        self.message_box.setText(message)
+        self.message_box.exec_()
 
     def show_status_message(self, message):
         """Display a status message in the UI.
@@ -9,6 +9,9 @@ import numpy as np
 from scipy.optimize import linprog
 from player import PlayerType
 
+# Presolve finds nothing to remove from the dense game LPs and only adds time
+LINPROG_OPTIONS = {"presolve": False}
+
 class LPSolver:
     """Linear programming solver for game theory problems."""
 
@@ -24,36 +27,89 @@ class LPSolver:
         Returns:
             list: Probability distribution over positions
         """
-        matrix = np.array(payoff_matrix)
+        # The payoff matrix may be stored as float32; linprog works in float64
+        matrix = np.asarray(payoff_matrix, dtype=np.float64)
+        closed_form = self._closed_form(matrix)
         if player_type == PlayerType.HIDER:
-            return self._solve_hider(matrix)
+            return closed_form[0] if closed_form is not None else self._solve_hider(matrix)
         elif player_type == PlayerType.SEEKER:
-            return self._solve_seeker(matrix)
+            return closed_form[1] if closed_form is not None else self._solve_seeker(matrix)
         else:
             raise ValueError("Invalid player type or view")
 
+    def solve_both(self, payoff_matrix):
+        """
+        Solve the game for both players' optimal mixed strategies with one LP.
+
+        The seeker's strategy is read from the duals of the hider's LP, which
+        are an optimal solution of the seeker's LP.
+
+        Args:
+            payoff_matrix (np.ndarray): Payoff matrix from the hider's perspective
+
+        Returns:
+            tuple: Hider and seeker probability distributions over positions
+        """
+        matrix = np.asarray(payoff_matrix, dtype=np.float64)
+        closed_form = self._closed_form(matrix)
+        if closed_form is not None:
+            return closed_form
+        res = self._hider_lp(matrix)
+        # One dual per hider constraint, i.e. per seeker position; they are <= 0
+        seeker = np.maximum(-res.ineqlin.marginals, 0)
+        return res.x[:matrix.shape[0]], seeker / seeker.sum()
+
+    def _closed_form(self, matrix):
+        # Both strategies for games that need no LP, or None
+        m, n = matrix.shape
+        if self._uniform_is_optimal(matrix):
+            return np.full(m, 1.0 / m), np.full(n, 1.0 / n)
+        if (m, n) == (2, 2):
+            return self._solve_2x2(matrix)
+        return None
+
+    def _solve_2x2(self, matrix):
+        (a, b), (c, d) = matrix
+        row_mins = matrix.min(axis=1)
+        col_maxs = matrix.max(axis=0)
+        # A saddle point is a pure equilibrium
+        if row_mins.max() == col_maxs.min():
+            return np.eye(2)[row_mins.argmax()], np.eye(2)[col_maxs.argmin()]
+        # Otherwise each player makes the other indifferent between their two positions
+        denominator = a - b - c + d
+        p = (d - c) / denominator
+        q = (d - b) / denominator
+        return np.array([p, 1 - p]), np.array([q, 1 - q])
+
+    def _uniform_is_optimal(self, matrix):
+        # If all row sums and all column sums are equal, uniform play holds each
+        # opponent position to the same payoff, which is then the game value
+        row_sums = matrix.sum(axis=1)
+        col_sums = matrix.sum(axis=0)
+        return np.allclose(row_sums, row_sums[0]) and np.allclose(col_sums, col_sums[0])
+
     def _solve_hider(self, matrix):
+        return self._hider_lp(matrix).x[:matrix.shape[0]]
+
+    def _hider_lp(self, matrix):
         # Maximize v, subject to: sum(p_i) = 1, p_i >= 0, and for all j: sum_i p_i * A[i][j] >= v
         m, n = matrix.shape
         c = np.zeros(m + 1) #objective function
         c[-1] = -1  # maximize v <=> minimize -v
 
-        # Constraints: sum_i p_i * A[i][j] - v >= 0  for all j
-        A_ub = []
-        b_ub = []
-        for j in range(n):
-            constraint = np.zeros(m + 1)
-            constraint[:m] = -matrix[:, j]
-            constraint[-1] = 1
-            A_ub.append(constraint)
-            b_ub.append(0)
+        # Constraints: sum_i p_i * A[i][j] - v >= 0  for all j, one row per j
+        A_ub = np.empty((n, m + 1))
+        A_ub[:, :m] = -matrix.T
+        A_ub[:, -1] = 1
+        b_ub = np.zeros(n)
         # sum_i p_i = 1
-        A_eq = [np.append(np.ones(m), 0)]
+        A_eq = np.append(np.ones(m), 0)[None, :]
         b_eq = [1]
         bounds = [(0, 1)] * m + [(None, None)]
-        res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs')
+        res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs',
+                      options=LINPROG_OPTIONS)
         if res.success:
-            return res.x[:m]
+            return res
         else:
             raise ValueError("Linear programming failed to find a solution")
 
@@ -63,20 +119,17 @@ class LPSolver:
         c = np.zeros(n + 1)
         c[-1] = 1  # minimize v
 
-        # Constraints: sum_j q_j * A[i][j] - v <= 0  for all i
-        A_ub = []
-        b_ub = []
-        for i in range(m):
-            constraint = np.zeros(n + 1)
-            constraint[:n] = matrix[i, :]
-            constraint[-1] = -1
-            A_ub.append(constraint)
-            b_ub.append(0)
+        # Constraints: sum_j q_j * A[i][j] - v <= 0  for all i, one row per i
+        A_ub = np.empty((m, n + 1))
+        A_ub[:, :n] = matrix
+        A_ub[:, -1] = -1
+        b_ub = np.zeros(m)
         # sum_j q_j = 1
-        A_eq = [np.append(np.ones(n), 0)]
+        A_eq = np.append(np.ones(n), 0)[None, :]
         b_eq = [1]
         bounds = [(0, 1)] * n + [(None, None)]
-        res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs')
+        res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds, method='highs',
+                      options=LINPROG_OPTIONS)
         if res.success:
             return res.x[:n]
         else:
@@ -11,7 +11,7 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QPushButton, QLabel, QComboBox, QSpinBox,
                             QGridLayout, QGroupBox, QRadioButton, QButtonGroup, 
                             QTabWidget, QScrollArea)
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QThread
 from PyQt5.QtGui import QFont, QColor
 
 from player import PlayerType
@@ -20,9 +20,46 @@ from game_logic import GameLogic
 from lp_solver import LPSolver
 from simulation import Simulation
 
-from visualization import GameVisualization
+from visualization import GameVisualization, probability_level, probability_levels
 from gameplay import GamePlay
 
+# Style sheets shared by the strategy views
+TITLE_STYLE = "font-size: 16px; font-weight: bold; color: white; background-color: #0d47a1; padding: 8px; border-radius: 4px;"
+EXPLANATION_STYLE = "margin-top: 5px; margin-bottom: 15px;"
+LEGEND_LABEL_STYLE = "font-weight: bold;"
+PLACE_LEGEND_STYLES = {
+    "EASY": "color: #4CAF50; font-weight: bold;",
+    "NEUTRAL": "color: #FFC107; font-weight: bold;",
+    "HARD": "color: #F44336; font-weight: bold;",
+}
+PLACE_LEGEND_TEXTS = {
+    "EASY": "■ Easy (best for hider)",
+    "NEUTRAL": "■ Neutral",
+    "HARD": "■ Hard (best for seeker)",
+}
+STRATEGY_TABS_STYLE = """
+QTabWidget::pane {
+    border: 1px solid #1e88e5;
+    border-radius: 5px;
+    padding: 10px;
+}
+QTabBar::tab {
+    background-color: #263238;
+    color: white;
+    border: 1px solid #1e88e5;
+    border-bottom-color: none;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+    padding: 8px 16px;
+    margin-right: 2px;
+    font-weight: bold;
+}
+QTabBar::tab:selected {
+    background-color: #1e88e5;
+    color: white;
+}
+"""
+
 class GameUI(QMainWindow, GameVisualization, GamePlay):
     """Main window for the Hide & Seek game."""
     
@@ -36,6 +73,22 @@ class GameUI(QMainWindow, GameVisualization, GamePlay):
         self.computer_player = None
         self.lp_solver = LPSolver()
         self.simulation = None
+        # Strategies the strategy view was built for: the computer's strategy in
+        # a game, (hider, seeker) strategies in a simulation
+        self.probability_view = None
+        self.sim_probability_view = None
+        # Message box reused by show_styled_message_box
+        self.message_box = None
+        # Worker solving the computer's strategy for a new world
+        self.strategy_worker = None
+        
+        # Fast-forwarded simulations run in a worker; the timer refreshes the stats
+        self.sim_worker = None
+        self.sim_snapshot = None
+        # Widgets disabled while the worker runs, re-enabled when it is done
+        self.sim_locked_widgets = []
+        self.sim_timer = QTimer(self)
+        self.sim_timer.timeout.connect(self.flush_simulation_stats)
         
         # Set color scheme
         self.setStyleSheet("""
@@ -91,7 +144,7 @@ class GameUI(QMainWindow, GameVisualization, GamePlay):
             QRadioButton::indicator:checked {
                 background-color: #1e88e5;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #263238;
                 color: white;
                 gridline-color: #1e88e5;
@@ -132,6 +185,15 @@ class GameUI(QMainWindow, GameVisualization, GamePlay):
         
         self.init_ui()
     
+    def closeEvent(self, event):
+        """Stop the worker threads before the window that owns them is destroyed."""
+        self.sim_timer.stop()
+        # Superseded strategy workers are still children until they finish
+        for worker in self.findChildren(QThread):
+            worker.requestInterruption()
+            worker.wait()
+        super().closeEvent(event)
+    
     def init_ui(self):
         """Initialize the user interface."""
         self.setWindowTitle('Hide & Seek Game - Dark Blue Theme')
@@ -307,6 +369,13 @@ class GameUI(QMainWindow, GameVisualization, GamePlay):
         self.play_btn.setEnabled(False)
         controls_layout.addWidget(self.play_btn)
         
+        # Fast forward button (simulation mode only)
+        self.fast_forward_btn = QPushButton("Fast Forward")
+        self.fast_forward_btn.setToolTip("Play many simulation rounds at once")
+        self.fast_forward_btn.clicked.connect(self.fast_forward_simulation)
+        self.fast_forward_btn.setVisible(False)
+        controls_layout.addWidget(self.fast_forward_btn)
+        
         # Reset button
         self.reset_btn = QPushButton("Reset Game")
         self.reset_btn.clicked.connect(self.reset_game)
@@ -326,32 +395,24 @@ class GameUI(QMainWindow, GameVisualization, GamePlay):
         stats_group = QGroupBox("Game Statistics")
         stats_layout = QHBoxLayout()
         
+        # One label per column, each updated with a single setText
         # Human player stats
-        human_stats_layout = QVBoxLayout()
-        human_stats_layout.addWidget(QLabel("Human Player:"))
-        self.human_score_label = QLabel("Score: 0")
-        self.human_wins_label = QLabel("Wins: 0")
-        human_stats_layout.addWidget(self.human_score_label)
-        human_stats_layout.addWidget(self.human_wins_label)
-        stats_layout.addLayout(human_stats_layout)
+        self.human_stats_label = QLabel()
+        self.human_stats_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        stats_layout.addWidget(self.human_stats_label)
         
         # Computer player stats
-        computer_stats_layout = QVBoxLayout()
-        computer_stats_layout.addWidget(QLabel("Computer Player:"))
-        self.computer_score_label = QLabel("Score: 0")
-        self.computer_wins_label = QLabel("Wins: 0")
-        computer_stats_layout.addWidget(self.computer_score_label)
-        computer_stats_layout.addWidget(self.computer_wins_label)
-        stats_layout.addLayout(computer_stats_layout)
+        self.computer_stats_label = QLabel()
+        self.computer_stats_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        stats_layout.addWidget(self.computer_stats_label)
         
         # Round info
-        round_layout = QVBoxLayout()
-        round_layout.addWidget(QLabel("Game Info:"))
-        self.round_label = QLabel("Round: 0")
-        self.result_label = QLabel("Result: -")
-        round_layout.addWidget(self.round_label)
-        round_layout.addWidget(self.result_label)
-        stats_layout.addLayout(round_layout)
+        self.game_info_label = QLabel()
+        self.game_info_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        stats_layout.addWidget(self.game_info_label)
+        
+        self.show_player_stats()
+        self.show_game_info(0, "-")
         
         # Status message
         status_layout = QVBoxLayout()
@@ -370,29 +431,38 @@ class GameUI(QMainWindow, GameVisualization, GamePlay):
         """Update the visualization of computer strategy probabilities."""
         if not hasattr(self, 'computer_player') or not hasattr(self.computer_player, 'strategy_probabilities'):
             return
+        # The strategy of a new world may still be solving
+        if len(self.computer_player.strategy_probabilities) != self.world.size:
+            return
+        # Rebuilds queued before the view was last drawn have nothing to add
+        if self.probability_view is self.computer_player.strategy_probabilities:
+            return
             
+        # Rebuild with updates disabled, so the new widgets are painted once
+        strategy_widget = self.probability_grid.parentWidget()
+        strategy_widget.setUpdatesEnabled(False)
+        
         # Clear existing visualization
-        for i in reversed(range(self.probability_grid.count())):
-            item = self.probability_grid.itemAt(i)
-            if item.widget():
-                item.widget().deleteLater()
+        self.clear_probability_grid()
         
-        # Get strategy probabilities
-        probabilities = self.computer_player.strategy_probabilities
+        # The view is filled while detached and added to the grid in one call
+        view = QWidget()
+        view_grid = QGridLayout(view)
+        view_grid.setContentsMargins(0, 0, 0, 0)
         
-        # Find max probability for scaling
-        max_prob = max(probabilities) if len(probabilities) > 0 else 1.0
-        min_prob = min(probabilities) if len(probabilities) > 0 else 0.0
+        # Get strategy probabilities and the place type of every position
+        probabilities = self.computer_player.strategy_probabilities
+        places = self.world.flat_places()
         
         # Title and player role
         title_label = QLabel("COMPUTER STRATEGY ANALYSIS")
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold; color: white; background-color: #0d47a1; padding: 8px; border-radius: 4px;")
+        title_label.setStyleSheet(TITLE_STYLE)
         title_label.setAlignment(Qt.AlignCenter)
-        self.probability_grid.addWidget(title_label, 0, 0, 1, 5)
+        view_grid.addWidget(title_label, 0, 0, 1, 5)
         
         role_label = QLabel(f"Computer Player Role: {self.computer_player.type.name}")
         role_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #1e88e5; margin-top: 10px;")
-        self.probability_grid.addWidget(role_label, 1, 0, 1, 5)
+        view_grid.addWidget(role_label, 1, 0, 1, 5)
         
         # Add explanation of what the probabilities mean
         if self.computer_player.type == PlayerType.HIDER:
@@ -405,8 +475,8 @@ class GameUI(QMainWindow, GameVisualization, GamePlay):
                 "Positions with higher probabilities (darker blue) are strategic seeking spots that maximize the computer's expected payoff.")
             
         explanation.setWordWrap(True)
-        explanation.setStyleSheet("margin-top: 5px; margin-bottom: 15px;")
-        self.probability_grid.addWidget(explanation, 2, 0, 1, 5)
+        explanation.setStyleSheet(EXPLANATION_STYLE)
+        view_grid.addWidget(explanation, 2, 0, 1, 5)
         
         # Legend for probability colors
         legend_layout = QHBoxLayout()
@@ -417,7 +487,7 @@ class GameUI(QMainWindow, GameVisualization, GamePlay):
             intensity = i / 9.0  # 0.0 to 1.0
             color_box = QLabel()
             color_box.setFixedSize(15, 15)
-            color_box.setStyleSheet(f"background-color: rgba(33, 150, 243, {intensity}); border: 1px solid #1e88e5;")
+            self.set_label_style(color_box, cell="swatch", hider=probability_level(intensity))
             legend_layout.addWidget(color_box)
         
         legend_layout.addWidget(QLabel("High"))
@@ -425,19 +495,22 @@ class GameUI(QMainWindow, GameVisualization, GamePlay):
         # Add legend to grid
         legend_widget = QWidget()
         legend_widget.setLayout(legend_layout)
-        self.probability_grid.addWidget(legend_widget, 3, 0, 1, 5)
+        view_grid.addWidget(legend_widget, 3, 0, 1, 5)
         
         # Create a grid of colored squares representing probabilities
         if isinstance(self.world, World1D):
             # Create 1D grid of probabilities
             grid_row = 4  # Start after the legend
+            prob_texts = np.char.mod("%.4f", probabilities).tolist()
+            # Color level of every box, relative to the most likely position
+            levels = probability_levels(probabilities)
             
             # Add header row
             for i in range(self.world.size):
                 pos_header = QLabel(f"Position {i}")
                 pos_header.setAlignment(Qt.AlignCenter)
                 pos_header.setStyleSheet("color: #1e88e5; font-weight: bold;")
-                self.probability_grid.addWidget(pos_header, grid_row, i)
+                view_grid.addWidget(pos_header, grid_row, i)
             
             # Add probability boxes
             for i in range(self.world.size):
@@ -445,141 +518,76 @@ class GameUI(QMainWindow, GameVisualization, GamePlay):
                 color_box = QLabel()
                 color_box.setFixedSize(60, 60)
                 
-                # Calculate color intensity based on probability
-                prob = probabilities[i]
-                intensity = prob / max_prob if max_prob > 0 else 0
-                
                 # Set background color with intensity
-                color_box.setStyleSheet(f"background-color: rgba(33, 150, 243, {intensity}); border: 1px solid #1e88e5; border-radius: 4px;")
-                self.probability_grid.addWidget(color_box, grid_row + 1, i)
+                self.set_label_style(color_box, cell="box", hider=levels[i])
+                view_grid.addWidget(color_box, grid_row + 1, i)
                 
                 # Create probability label
-                prob_label = QLabel(f"{prob:.4f}")
+                prob_label = QLabel(prob_texts[i])
                 prob_label.setAlignment(Qt.AlignCenter)
-                self.probability_grid.addWidget(prob_label, grid_row + 2, i)
+                view_grid.addWidget(prob_label, grid_row + 2, i)
                 
                 # Create place type indicator
-                place_type = self.world.get_place_type(i)
+                place_type = places[i]
                 type_label = QLabel()
                 if place_type == PlaceType.EASY:
                     type_str = "Easy"
-                    type_label.setStyleSheet("background-color: #4CAF50; color: white; border-radius: 2px; padding: 2px;")
                 elif place_type == PlaceType.NEUTRAL:
                     type_str = "Neutral"
-                    type_label.setStyleSheet("background-color: #FFC107; color: black; border-radius: 2px; padding: 2px;")
                 else:  # HARD
                     type_str = "Hard"
-                    type_label.setStyleSheet("background-color: #F44336; color: white; border-radius: 2px; padding: 2px;")
+                self.set_label_style(type_label, cell="type", place=place_type.name)
                 type_label.setText(type_str)
                 type_label.setAlignment(Qt.AlignCenter)
-                self.probability_grid.addWidget(type_label, grid_row + 3, i)
+                view_grid.addWidget(type_label, grid_row + 3, i)
             
         elif isinstance(self.world, World2D):
             # 2D world - display as a grid
             grid_row = 4  # Start after the legend
             
             # Create better legends similar to simulation mode
-            place_legend_widget = QWidget()
-            place_legend_layout = QHBoxLayout(place_legend_widget)
-            place_legend_layout.setContentsMargins(0, 5, 0, 10)
-            
-            place_legend_label = QLabel("Place Types:")
-            place_legend_label.setStyleSheet("font-weight: bold;")
-            place_legend_layout.addWidget(place_legend_label)
-            
-            easy_legend = QLabel("■ Easy (best for hider)")
-            easy_legend.setStyleSheet("color: #4CAF50; font-weight: bold;")
-            neutral_legend = QLabel("■ Neutral")
-            neutral_legend.setStyleSheet("color: #FFC107; font-weight: bold;")
-            hard_legend = QLabel("■ Hard (best for seeker)")
-            hard_legend.setStyleSheet("color: #F44336; font-weight: bold;")
-            
-            place_legend_layout.addWidget(easy_legend)
-            place_legend_layout.addWidget(neutral_legend)
-            place_legend_layout.addWidget(hard_legend)
-            place_legend_layout.addStretch(1)
+            place_legend_widget = self.create_place_legend()
+            place_legend_widget.layout().setContentsMargins(0, 5, 0, 10)
             
-            self.probability_grid.addWidget(place_legend_widget, 3, 0, 1, self.world.cols + 2)
+            view_grid.addWidget(place_legend_widget, 3, 0, 1, self.world.cols + 2)
             
-            # Add column headers
-            for c in range(self.world.cols):
-                col_label = QLabel(f"Col {c}")
-                col_label.setAlignment(Qt.AlignCenter)
-                col_label.setStyleSheet("color: #1e88e5; font-weight: bold;")
-                self.probability_grid.addWidget(col_label, grid_row, c + 1)
-            
-            # Add row headers and probability cells
-            index = 0
-            for r in range(self.world.rows):
-                # Row header
-                row_label = QLabel(f"Row {r}")
-                row_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                row_label.setStyleSheet("color: #1e88e5; font-weight: bold;")
-                self.probability_grid.addWidget(row_label, grid_row + r + 1, 0)
-                
-                for c in range(self.world.cols):
-                    # Create better container for probability info
-                    cell_container = QLabel()
-                    cell_container.setFixedSize(80, 80)
-                    
-                    # Calculate color intensity
-                    prob = probabilities[index]
-                    intensity = prob / max_prob if max_prob > 0 else 0
-                    
-                    # Set place type indicator as border color
-                    place_type = self.world.get_place_type((r, c))
-                    if place_type == PlaceType.EASY:
-                        border_color = "#4CAF50"  # Green
-                        place_icon = "E"  # Easy
-                    elif place_type == PlaceType.NEUTRAL:
-                        border_color = "#FFC107"  # Yellow
-                        place_icon = "N"  # Neutral
-                    else:  # HARD
-                        border_color = "#F44336"  # Red
-                        place_icon = "H"  # Hard
-                    
-                    # Use darker text for light backgrounds and light text for dark backgrounds
-                    text_color = "white" if intensity > 0.3 else "#121212"
-                    
-                    # Set background color with intensity and border indicating place type
-                    cell_container.setText(f"<div align='center'><b>{prob:.4f}</b><br>{place_icon}</div>")
-                    cell_container.setAlignment(Qt.AlignCenter)
-                    cell_container.setStyleSheet(f"""
-                        background-color: rgba(33, 150, 243, {intensity});
-                        border: 3px solid {border_color};
-                        border-radius: 8px;
-                        color: {text_color};
-                        font-weight: bold;
-                        font-size: 16px;
-                        padding: 4px;
-                    """)
-                    
-                    # Add to grid
-                    self.probability_grid.addWidget(cell_container, grid_row + r + 1, c + 1)
-                    
-                    index += 1
-        
-        # Make the tab visible to ensure rendering
-        self.tab_widget.setCurrentIndex(1)  # Switch to the strategy visualization tab
-        # Switch back to the game board tab
-        self.tab_widget.setCurrentIndex(0)
+            # One card per position, with the place type as its border
+            view_grid.addWidget(self.create_probability_table(probabilities),
+                                grid_row, 0, 1, self.world.cols + 2, Qt.AlignLeft)
+        
+        self.probability_grid.addWidget(view, 0, 0)
+        self.probability_view = probabilities
+        strategy_widget.setUpdatesEnabled(True)
 
     def update_simulation_probability_visualization(self):
         """Display both hider and seeker strategies in simulation mode"""
         if not hasattr(self, 'simulation') or not hasattr(self, 'hider_player') or not hasattr(self, 'seeker_player'):
             return
+        
+        # Both strategies are fixed during a simulation, so the view is only
+        # rebuilt when they change, not on every round
+        strategies = (self.hider_player.strategy_probabilities, self.seeker_player.strategy_probabilities)
+        if self.sim_probability_view is not None and all(
+                shown is strategy for shown, strategy in zip(self.sim_probability_view, strategies)):
+            return
             
+        # Rebuild with updates disabled, so the new widgets are painted once
+        strategy_widget = self.probability_grid.parentWidget()
+        strategy_widget.setUpdatesEnabled(False)
+        
         # Clear existing visualization
-        for i in reversed(range(self.probability_grid.count())):
-            item = self.probability_grid.itemAt(i)
-            if item.widget():
-                item.widget().deleteLater()
+        self.clear_probability_grid()
+        
+        # The view is filled while detached and added to the grid in one call
+        view = QWidget()
+        view_grid = QGridLayout(view)
+        view_grid.setContentsMargins(0, 0, 0, 0)
         
         # Show title
         title_label = QLabel("SIMULATION STRATEGY ANALYSIS")
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold; color: white; background-color: #0d47a1; padding: 8px; border-radius: 4px;")
+        title_label.setStyleSheet(TITLE_STYLE)
         title_label.setAlignment(Qt.AlignCenter)
-        self.probability_grid.addWidget(title_label, 0, 0, 1, 6)
+        view_grid.addWidget(title_label, 0, 0, 1, 6)
         
         # Add explanation
         explanation = QLabel(
@@ -587,101 +595,70 @@ class GameUI(QMainWindow, GameVisualization, GamePlay):
             "The colors below show the probability distribution for each player's strategy. "
             "Blue for Hider (darker = higher probability), Red for Seeker (darker = higher probability).")
         explanation.setWordWrap(True)
-        explanation.setStyleSheet("margin-top: 5px; margin-bottom: 15px;")
-        self.probability_grid.addWidget(explanation, 1, 0, 1, 6)
+        explanation.setStyleSheet(EXPLANATION_STYLE)
+        view_grid.addWidget(explanation, 1, 0, 1, 6)
         
-        # Get strategies
+        # Get strategies and the place type of every position
         hider_probs = self.hider_player.strategy_probabilities
         seeker_probs = self.seeker_player.strategy_probabilities
-        
-        # Find max values for scaling
-        hider_max = max(hider_probs) if len(hider_probs) > 0 else 1.0
-        seeker_max = max(seeker_probs) if len(seeker_probs) > 0 else 1.0
+        places = self.world.flat_places()
         
         # Create headers for both players
         hider_header = QLabel("HIDER STRATEGY")
         hider_header.setStyleSheet("font-size: 14px; font-weight: bold; color: #2196F3;")
         hider_header.setAlignment(Qt.AlignCenter)
-        self.probability_grid.addWidget(hider_header, 2, 0, 1, 3)
+        view_grid.addWidget(hider_header, 2, 0, 1, 3)
         
         seeker_header = QLabel("SEEKER STRATEGY")
         seeker_header.setStyleSheet("font-size: 14px; font-weight: bold; color: #F44336;")
         seeker_header.setAlignment(Qt.AlignCenter)
-        self.probability_grid.addWidget(seeker_header, 2, 3, 1, 3)
+        view_grid.addWidget(seeker_header, 2, 3, 1, 3)
         
         if isinstance(self.world, World1D):
             # 1D world - show as two side-by-side grids
             grid_row = 3
+            hider_texts = np.char.mod("%.4f", hider_probs).tolist()
+            seeker_texts = np.char.mod("%.4f", seeker_probs).tolist()
+            hider_levels = probability_levels(hider_probs)
+            seeker_levels = probability_levels(seeker_probs)
             
             # Position labels column
             for i in range(self.world.size):
                 # Position label
                 pos_label = QLabel(f"Position {i}")
                 pos_label.setAlignment(Qt.AlignCenter)
-                self.probability_grid.addWidget(pos_label, grid_row + i, 0)
+                view_grid.addWidget(pos_label, grid_row + i, 0)
                 
                 # Hider probability box
                 h_box = QLabel()
                 h_box.setFixedSize(60, 40)
-                h_prob = hider_probs[i]
-                h_intensity = h_prob / hider_max if hider_max > 0 else 0
                 
                 # Place type indicator as border
-                place_type = self.world.get_place_type(i)
-                if place_type == PlaceType.EASY:
-                    border_color = "#4CAF50"  # Green
-                elif place_type == PlaceType.NEUTRAL:
-                    border_color = "#FFC107"  # Yellow
-                else:  # HARD
-                    border_color = "#F44336"  # Red
-                    
-                h_box.setStyleSheet(f"background-color: rgba(33, 150, 243, {h_intensity}); border: 2px solid {border_color}; border-radius: 4px;")
-                self.probability_grid.addWidget(h_box, grid_row + i, 1)
+                place = places[i].name
+                self.set_label_style(h_box, cell="sim-box", place=place, hider=hider_levels[i])
+                view_grid.addWidget(h_box, grid_row + i, 1)
                 
                 # Hider probability value
-                h_label = QLabel(f"{h_prob:.4f}")
+                h_label = QLabel(hider_texts[i])
                 h_label.setAlignment(Qt.AlignCenter)
-                self.probability_grid.addWidget(h_label, grid_row + i, 2)
+                view_grid.addWidget(h_label, grid_row + i, 2)
                 
                 # Seeker probability box
                 s_box = QLabel()
                 s_box.setFixedSize(60, 40)
-                s_prob = seeker_probs[i]
-                s_intensity = s_prob / seeker_max if seeker_max > 0 else 0
-                s_box.setStyleSheet(f"background-color: rgba(244, 67, 54, {s_intensity}); border: 2px solid {border_color}; border-radius: 4px;")
-                self.probability_grid.addWidget(s_box, grid_row + i, 4)
+                self.set_label_style(s_box, cell="sim-box", place=place, seeker=seeker_levels[i])
+                view_grid.addWidget(s_box, grid_row + i, 4)
                 
                 # Seeker probability value
-                s_label = QLabel(f"{s_prob:.4f}")
+                s_label = QLabel(seeker_texts[i])
                 s_label.setAlignment(Qt.AlignCenter)
-                self.probability_grid.addWidget(s_label, grid_row + i, 5)
+                view_grid.addWidget(s_label, grid_row + i, 5)
             
         elif isinstance(self.world, World2D):
             # For 2D world, use tabs to switch between hider and seeker visualizations
             # Create a tab widget
             strat_tabs = QTabWidget()
-            strat_tabs.setStyleSheet("""
-                QTabWidget::pane {
-                    border: 1px solid #1e88e5;
-                    border-radius: 5px;
-                    padding: 10px;
-                }
-                QTabBar::tab {
-                    background-color: #263238;
-                    color: white;
-                    border: 1px solid #1e88e5;
-                    border-bottom-color: none;
-                    border-top-left-radius: 4px;
-                    border-top-right-radius: 4px;
-                    padding: 8px 16px;
-                    margin-right: 2px;
-                    font-weight: bold;
-                }
-                QTabBar::tab:selected {
-                    background-color: #1e88e5;
-                    color: white;
-                }
-            """)
+            strat_tabs.setStyleSheet(STRATEGY_TABS_STYLE)
             
             hider_tab = QWidget()
             seeker_tab = QWidget()
@@ -691,241 +668,87 @@ class GameUI(QMainWindow, GameVisualization, GamePlay):
             seeker_layout = QGridLayout(seeker_tab)
             seeker_layout.setSpacing(8)
             
-            # Create legend for place types and probability
-            legend_widget = QWidget()
-            legend_layout = QVBoxLayout(legend_widget)
-            legend_layout.setContentsMargins(0, 5, 0, 10)
-            
-            # Place type legend
-            place_type_widget = QWidget()
-            place_type_layout = QHBoxLayout(place_type_widget)
-            place_type_layout.setContentsMargins(0, 0, 0, 0)
-            
-            place_legend_label = QLabel("Place Types:")
-            place_legend_label.setStyleSheet("font-weight: bold;")
-            place_type_layout.addWidget(place_legend_label)
-            
-            easy_legend = QLabel("■ Easy (best for hider)")
-            easy_legend.setStyleSheet("color: #4CAF50; font-weight: bold;")
-            neutral_legend = QLabel("■ Neutral")
-            neutral_legend.setStyleSheet("color: #FFC107; font-weight: bold;")
-            hard_legend = QLabel("■ Hard (best for seeker)")
-            hard_legend.setStyleSheet("color: #F44336; font-weight: bold;")
-            
-            place_type_layout.addWidget(easy_legend)
-            place_type_layout.addWidget(neutral_legend)
-            place_type_layout.addWidget(hard_legend)
-            place_type_layout.addStretch(1)
-            
-            legend_layout.addWidget(place_type_widget)
-            
-            # Probability scale legend
-            prob_scale_widget = QWidget()
-            prob_scale_layout = QHBoxLayout(prob_scale_widget)
-            prob_scale_layout.setContentsMargins(0, 0, 0, 0)
-            
-            prob_legend_label = QLabel("Probability Scale:")
-            prob_legend_label.setStyleSheet("font-weight: bold;")
-            prob_scale_layout.addWidget(prob_legend_label)
-            
-            # Create color gradient for legend
-            prob_scale_layout.addWidget(QLabel("Low"))
-            
-            for i in range(5):
-                intensity = i / 4.0  # 0.0 to 1.0
-                hider_box = QLabel()
-                hider_box.setFixedSize(15, 15)
-                hider_box.setStyleSheet(f"background-color: rgba(33, 150, 243, {intensity}); border: 1px solid #1e88e5;")
-                prob_scale_layout.addWidget(hider_box)
-                
-                seeker_box = QLabel()
-                seeker_box.setFixedSize(15, 15)
-                seeker_box.setStyleSheet(f"background-color: rgba(244, 67, 54, {intensity}); border: 1px solid #F44336;")
-                prob_scale_layout.addWidget(seeker_box)
-            
-            prob_scale_layout.addWidget(QLabel("High"))
-            prob_scale_layout.addStretch(1)
+            # Each tab gets its own legend, a widget can only have one parent
+            hider_layout.addWidget(self.create_strategy_legend(), 0, 0, 1, self.world.cols + 2)
+            seeker_layout.addWidget(self.create_strategy_legend(), 0, 0, 1, self.world.cols + 2)
             
-            legend_layout.addWidget(prob_scale_widget)
-            
-            # Add legend to both tabs
-            hider_layout.addWidget(legend_widget, 0, 0, 1, self.world.cols + 2)
-            
-            # Create a duplicate legend for seeker tab
-            seeker_legend_widget = QWidget()
-            seeker_legend_layout = QVBoxLayout(seeker_legend_widget)
-            seeker_legend_layout.setContentsMargins(0, 5, 0, 10)
-            
-            # Place type legend for seeker tab
-            seeker_place_widget = QWidget()
-            seeker_place_layout = QHBoxLayout(seeker_place_widget)
-            seeker_place_layout.setContentsMargins(0, 0, 0, 0)
-            
-            seeker_place_label = QLabel("Place Types:")
-            seeker_place_label.setStyleSheet("font-weight: bold;")
-            seeker_place_layout.addWidget(seeker_place_label)
-            
-            seeker_easy_legend = QLabel("■ Easy (best for hider)")
-            seeker_easy_legend.setStyleSheet("color: #4CAF50; font-weight: bold;")
-            seeker_neutral_legend = QLabel("■ Neutral")
-            seeker_neutral_legend.setStyleSheet("color: #FFC107; font-weight: bold;")
-            seeker_hard_legend = QLabel("■ Hard (best for seeker)")
-            seeker_hard_legend.setStyleSheet("color: #F44336; font-weight: bold;")
-            
-            seeker_place_layout.addWidget(seeker_easy_legend)
-            seeker_place_layout.addWidget(seeker_neutral_legend)
-            seeker_place_layout.addWidget(seeker_hard_legend)
-            seeker_place_layout.addStretch(1)
-            
-            seeker_legend_layout.addWidget(seeker_place_widget)
-            
-            # Probability scale for seeker tab
-            seeker_prob_widget = QWidget()
-            seeker_prob_layout = QHBoxLayout(seeker_prob_widget)
-            seeker_prob_layout.setContentsMargins(0, 0, 0, 0)
-            
-            seeker_prob_label = QLabel("Probability Scale:")
-            seeker_prob_label.setStyleSheet("font-weight: bold;")
-            seeker_prob_layout.addWidget(seeker_prob_label)
-            
-            # Create color gradient for legend on seeker tab
-            seeker_prob_layout.addWidget(QLabel("Low"))
-            
-            for i in range(5):
-                intensity = i / 4.0  # 0.0 to 1.0
-                hider_box = QLabel()
-                hider_box.setFixedSize(15, 15)
-                hider_box.setStyleSheet(f"background-color: rgba(33, 150, 243, {intensity}); border: 1px solid #1e88e5;")
-                seeker_prob_layout.addWidget(hider_box)
-                
-                seeker_box = QLabel()
-                seeker_box.setFixedSize(15, 15)
-                seeker_box.setStyleSheet(f"background-color: rgba(244, 67, 54, {intensity}); border: 1px solid #F44336;")
-                seeker_prob_layout.addWidget(seeker_box)
-            
-            seeker_prob_layout.addWidget(QLabel("High"))
-            seeker_prob_layout.addStretch(1)
-            
-            seeker_legend_layout.addWidget(seeker_prob_widget)
-            
-            seeker_layout.addWidget(seeker_legend_widget, 0, 0, 1, self.world.cols + 2)
-            
-            # Populate hider tab
-            index = 0
-            for r in range(self.world.rows):
-                # Row label
-                row_label = QLabel(f"Row {r}")
-                row_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                row_label.setStyleSheet("color: #1e88e5; font-weight: bold;")
-                hider_layout.addWidget(row_label, r + 2, 0)
-                
-                for c in range(self.world.cols):
-                    # Column headers (only once)
-                    if r == 0:
-                        col_label = QLabel(f"Col {c}")
-                        col_label.setAlignment(Qt.AlignCenter)
-                        col_label.setStyleSheet("color: #1e88e5; font-weight: bold;")
-                        hider_layout.addWidget(col_label, 1, c + 1)
-                    
-                    # Place type indicator
-                    place_type = self.world.get_place_type((r, c))
-                    if place_type == PlaceType.EASY:
-                        border_color = "#4CAF50"  # Green
-                        place_icon = "E"  # Easy
-                    elif place_type == PlaceType.NEUTRAL:
-                        border_color = "#FFC107"  # Yellow
-                        place_icon = "N"  # Neutral
-                    else:  # HARD
-                        border_color = "#F44336"  # Red
-                        place_icon = "H"  # Hard
-                    
-                    # Create a better container for the probability info
-                    h_container = QLabel()
-                    h_container.setFixedSize(80, 80)
-                    h_prob = hider_probs[index]
-                    h_intensity = h_prob / hider_max if hider_max > 0 else 0
-                    
-                    # Use darker text for light backgrounds and light text for dark backgrounds
-                    text_color = "white" if h_intensity > 0.3 else "#121212"
-                    
-                    # Display probability more clearly
-                    h_container.setText(f"<div align='center'><b>{h_prob:.4f}</b><br>{place_icon}</div>")
-                    h_container.setAlignment(Qt.AlignCenter)
-                    h_container.setStyleSheet(f"""
-                        background-color: rgba(33, 150, 243, {h_intensity});
-                        border: 3px solid {border_color};
-                        border-radius: 8px;
-                        color: {text_color};
-                        font-weight: bold;
-                        font-size: 16px;
-                        padding: 4px;
-                    """)
-                    hider_layout.addWidget(h_container, r + 2, c + 1)
-                    
-                    index += 1
-            
-            # Populate seeker tab
-            index = 0
-            for r in range(self.world.rows):
-                # Row label
-                row_label = QLabel(f"Row {r}")
-                row_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                row_label.setStyleSheet("color: #1e88e5; font-weight: bold;")
-                seeker_layout.addWidget(row_label, r + 2, 0)
-                
-                for c in range(self.world.cols):
-                    # Column headers (only once)
-                    if r == 0:
-                        col_label = QLabel(f"Col {c}")
-                        col_label.setAlignment(Qt.AlignCenter)
-                        col_label.setStyleSheet("color: #1e88e5; font-weight: bold;")
-                        seeker_layout.addWidget(col_label, 1, c + 1)
-                    
-                    # Place type indicator
-                    place_type = self.world.get_place_type((r, c))
-                    if place_type == PlaceType.EASY:
-                        border_color = "#4CAF50"  # Green
-                        place_icon = "E"  # Easy
-                    elif place_type == PlaceType.NEUTRAL:
-                        border_color = "#FFC107"  # Yellow
-                        place_icon = "N"  # Neutral
-                    else:  # HARD
-                        border_color = "#F44336"  # Red
-                        place_icon = "H"  # Hard
-                    
-                    # Create a better container for the probability info
-                    s_container = QLabel()
-                    s_container.setFixedSize(80, 80)
-                    s_prob = seeker_probs[index]
-                    s_intensity = s_prob / seeker_max if seeker_max > 0 else 0
-                    
-                    # Use darker text for light backgrounds and light text for dark backgrounds
-                    text_color = "white" if s_intensity > 0.3 else "#121212"
-                    
-                    # Display probability more clearly
-                    s_container.setText(f"<div align='center'><b>{s_prob:.4f}</b><br>{place_icon}</div>")
-                    s_container.setAlignment(Qt.AlignCenter)
-                    s_container.setStyleSheet(f"""
-                        background-color: rgba(244, 67, 54, {s_intensity});
-                        border: 3px solid {border_color};
-                        border-radius: 8px;
-                        color: {text_color};
-                        font-weight: bold;
-                        font-size: 16px;
-                        padding: 4px;
-                    """)
-                    seeker_layout.addWidget(s_container, r + 2, c + 1)
-                    
-                    index += 1
+            # One card per position in each tab, with the place type as its border
+            hider_layout.addWidget(self.create_probability_table(hider_probs, "hider"),
+                                   1, 0, 1, self.world.cols + 2, Qt.AlignLeft)
+            seeker_layout.addWidget(self.create_probability_table(seeker_probs, "seeker"),
+                                    1, 0, 1, self.world.cols + 2, Qt.AlignLeft)
             
             # Add tabs to tab widget
             strat_tabs.addTab(hider_tab, "Hider Strategy")
             strat_tabs.addTab(seeker_tab, "Seeker Strategy")
             
             # Add tab widget to grid
-            self.probability_grid.addWidget(strat_tabs, 3, 0, 10, 6)
+            view_grid.addWidget(strat_tabs, 3, 0, 10, 6)
+        
+        self.probability_grid.addWidget(view, 0, 0)
+        self.sim_probability_view = strategies
+        strategy_widget.setUpdatesEnabled(True) 
+
+    def create_place_legend(self):
+        """
+        Create the legend of the place type colors.
+        
+        Returns:
+            QWidget: A row with one colored entry per place type
+        """
+        place_legend_widget = QWidget()
+        place_legend_layout = QHBoxLayout(place_legend_widget)
+        place_legend_layout.setContentsMargins(0, 0, 0, 0)
+        
+        place_legend_label = QLabel("Place Types:")
+        place_legend_label.setStyleSheet(LEGEND_LABEL_STYLE)
+        place_legend_layout.addWidget(place_legend_label)
+        
+        for place, text in PLACE_LEGEND_TEXTS.items():
+            place_label = QLabel(text)
+            place_label.setStyleSheet(PLACE_LEGEND_STYLES[place])
+            place_legend_layout.addWidget(place_label)
+        place_legend_layout.addStretch(1)
+        return place_legend_widget
+
+    def create_strategy_legend(self):
+        """
+        Create the legend of a simulation strategy tab.
+        
+        Returns:
+            QWidget: The place type legend above the hider and seeker probability scale
+        """
+        legend_widget = QWidget()
+        legend_layout = QVBoxLayout(legend_widget)
+        legend_layout.setContentsMargins(0, 5, 0, 10)
+        legend_layout.addWidget(self.create_place_legend())
+        
+        # Probability scale legend
+        prob_scale_widget = QWidget()
+        prob_scale_layout = QHBoxLayout(prob_scale_widget)
+        prob_scale_layout.setContentsMargins(0, 0, 0, 0)
+        
+        prob_legend_label = QLabel("Probability Scale:")
+        prob_legend_label.setStyleSheet(LEGEND_LABEL_STYLE)
+        prob_scale_layout.addWidget(prob_legend_label)
+        
+        # Create color gradient for legend
+        prob_scale_layout.addWidget(QLabel("Low"))
+        
+        for i in range(5):
+            intensity = i / 4.0  # 0.0 to 1.0
+            hider_box = QLabel()
+            hider_box.setFixedSize(15, 15)
+            self.set_label_style(hider_box, cell="swatch", hider=probability_level(intensity))
+            prob_scale_layout.addWidget(hider_box)
+            
+            seeker_box = QLabel()
+            seeker_box.setFixedSize(15, 15)
+            self.set_label_style(seeker_box, cell="seeker-swatch", seeker=probability_level(intensity))
+            prob_scale_layout.addWidget(seeker_box)
+        
+        prob_scale_layout.addWidget(QLabel("High"))
+        prob_scale_layout.addStretch(1)
         
-        # Make the tab visible to ensure rendering
-        self.tab_widget.setCurrentIndex(1)  # Switch to the strategy visualization tab
-        # Switch back to the game board tab
-        self.tab_widget.setCurrentIndex(0) 
\ No newline at end of file
+        legend_layout.addWidget(prob_scale_widget)
+        return legend_widget
\ No newline at end of file
@@ -8,7 +8,6 @@ both human and computer players.
 import random
 import numpy as np
 from enum import Enum
-import random as rd
 class PlayerType(Enum):
     HIDER = 1
     SEEKER = 2
@@ -16,10 +15,41 @@ class PlayerType(Enum):
 class Player:
     def __init__(self, player_type):
         self.type = player_type
-        self.score = 0
-        self.wins = 0
+        # Score and wins are kept in one-element arrays so GameLogic can swap
+        # them for views of its shared stats buffers (see bind_stats)
+        self._score = np.zeros(1)
+        self._wins = np.zeros(1, dtype=np.int64)
         self.strategy_probabilities = []
         self.strategy_probabilities_copy = []
+
+    @property
+    def score(self):
+        return float(self._score[0])
+
+    @score.setter
+    def score(self, value):
+        self._score[0] = value
+
+    @property
+    def wins(self):
+        return int(self._wins[0])
+
+    @wins.setter
+    def wins(self, value):
+        self._wins[0] = value
+
+    def bind_stats(self, score_slot, wins_slot):
+        """
+        Store the score and wins in slots of shared buffers.
+
+        Args:
+            score_slot (np.ndarray): One-element float view for the score
+            wins_slot (np.ndarray): One-element int view for the wins
+        """
+        score_slot[0] = self._score[0]
+        wins_slot[0] = self._wins[0]
+        self._score = score_slot
+        self._wins = wins_slot
     
     def make_move(self, world):
         raise NotImplementedError("Subclasses must implement make_move()")
@@ -41,7 +71,7 @@ class HumanPlayer(Player):
         self.move = None
     
     def set_move(self, move):
-        """Set the player's move."""
+        """Set the player's move as a flat position index."""
         self.move = move
     
     def make_move(self, world):
@@ -49,38 +79,47 @@ class HumanPlayer(Player):
         return self.move
 
 class ComputerPlayer(Player):
+    # Number of moves drawn at once from the mixed strategy
+    MOVE_BUFFER_SIZE = 1024
+
     def __init__(self, player_type):
         """Initialize a computer player."""
         super().__init__(player_type)
         self.strategy_probabilities = []
-        self.counter = 0
-        self.strategist = []
-        self.options = []
+        self.rng = np.random.default_rng()
+        self.move_buffer = []
+
+    def set_rng(self, rng):
+        """Draw moves from rng and drop moves drawn from the previous generator."""
+        self.rng = rng
+        self.move_buffer = []
+
     def set_strategy(self, probabilities):
+        """Set the mixed strategy and drop moves drawn from the previous one."""
+        self.strategy_probabilities = np.asarray(probabilities, dtype=float)
+        self.move_buffer = []
+
+    def make_move_batch(self, n):
+        """
+        Draw n moves from the mixed strategy.
+
+        Args:
+            n (int): Number of moves to draw
 
-        self.strategy_probabilities = probabilities
- 
-        self.options = []
-        for i in range(len(self.strategy_probabilities)):
-            self.options.append(i)
-        self.strategist=rd.choices(self.options,self.strategy_probabilities,k=10)
+        Returns:
+            np.ndarray: Position indices
+        """
+        probabilities = np.asarray(self.strategy_probabilities, dtype=float)
+        return self.rng.choice(probabilities.size, size=n, p=probabilities / probabilities.sum())
     
     def make_move(self, world):
         if (isinstance(self.strategy_probabilities, list) and not self.strategy_probabilities) or \
            (isinstance(self.strategy_probabilities, np.ndarray) and self.strategy_probabilities.size == 0) or \
            len(self.strategy_probabilities) != world.size:
             raise ValueError("Strategy probabilities not set or do not match world size")
-        else:
-            idx = self.strategist[self.counter]
-            self.counter += 1
-            if self.counter == 10:
-                self.strategist=rd.choices(self.options,self.strategy_probabilities,k=10)
-                self.counter = 0
-        # For 2D world, convert index to (row, col)
-        if hasattr(world, 'index_to_pos'):
-            return world.index_to_pos(idx)
-        else:
-            return idx
+        if not self.move_buffer:
+            self.move_buffer = self.make_move_batch(self.MOVE_BUFFER_SIZE).tolist()
+        return self.move_buffer.pop()
    
         
 
@@ -91,11 +130,4 @@ class RandomPlayer(Player):
     
     def make_move(self, world):
         """Make a random move."""
-        if hasattr(world, 'rows') and hasattr(world, 'cols'):
-            # For 2D world
-            row = random.randint(0, world.rows - 1)
-            col = random.randint(0, world.cols - 1)
-            return (row, col)
-        else:
-            # For 1D world
-            return random.randint(0, world.size - 1)
+        return random.randint(0, world.size - 1)
@@ -5,12 +5,35 @@ This module handles the simulation mode where the computer plays
 against a random player for multiple rounds.
 """
 
+import os
+import multiprocessing
 import numpy as np
 from player import ComputerPlayer, PlayerType
 from world import World1D, World2D, BaseWorld
 from game_logic import GameLogic
 from lp_solver import LPSolver
 
+# Below this many rounds a single vectorized batch is faster than a process pool
+PARALLEL_MIN_ROUNDS = 1_000_000
+
+def _simulate_batch(args):
+    """
+    Play a batch of rounds in a worker process.
+    
+    Args:
+        args (tuple): (seed, num_rounds, payoff_matrix, hider_strategy, seeker_strategy)
+        
+    Returns:
+        tuple: (total_payoff, seeker_wins)
+    """
+    seed, num_rounds, payoff_matrix, hider_strategy, seeker_strategy = args
+    rng = np.random.default_rng(seed)
+    k = payoff_matrix.shape[0]
+    hider_idx = rng.choice(k, size=num_rounds, p=hider_strategy)
+    seeker_idx = rng.choice(k, size=num_rounds, p=seeker_strategy)
+    total_payoff = payoff_matrix[hider_idx, seeker_idx].sum(dtype=np.float64)
+    return total_payoff, int(np.count_nonzero(hider_idx == seeker_idx))
+
 class Simulation:
     """Manages the simulation mode of the game."""
     
@@ -28,12 +51,9 @@ class Simulation:
         self.hider = ComputerPlayer(PlayerType.HIDER)
         self.seeker = ComputerPlayer(PlayerType.SEEKER)
         
-        # Set strategies for both players
-        payoff_matrix = self.world.get_payoff_matrix()
-        
-        # Solve for optimal strategies
-        hider_strategy = self.lp_solver.solve_game(payoff_matrix, PlayerType.HIDER)
-        seeker_strategy = self.lp_solver.solve_game(payoff_matrix, PlayerType.SEEKER)
+        # Solve for optimal strategies (reuses any strategy already solved on this world)
+        hider_strategy = self.world.get_strategy(PlayerType.HIDER, self.lp_solver)
+        seeker_strategy = self.world.get_strategy(PlayerType.SEEKER, self.lp_solver)
         
         # Debug print
         print("Debug - Strategies:")
@@ -52,12 +72,16 @@ class Simulation:
         self.total_payoff = 0
         self.rounds_played = 0
     
-    def run(self, num_rounds=100):
+    def run(self, num_rounds=100, processes=None):
         """
         Run the simulation for a specified number of rounds.
         
+        Large runs are split into independent batches played in parallel
+        worker processes, each with its own random stream.
+        
         Args:
             num_rounds (int): Number of rounds to simulate
+            processes (int): Number of worker processes (defaults to the CPU count)
             
         Returns:
             dict: Dictionary containing simulation results
@@ -67,16 +91,45 @@ class Simulation:
         self.total_payoff = 0
         self.rounds_played = 0
         
-        for _ in range(num_rounds):
-            hider_pos, seeker_pos, payoff, found = self.game_logic.play_round()
+        processes = processes or os.cpu_count() or 1
+        if processes == 1 or num_rounds < PARALLEL_MIN_ROUNDS:
+            return self.advance(num_rounds)
+        
+        payoff_matrix = self.world.get_payoff_matrix()
+        hider_strategy, seeker_strategy = self.game_logic.get_mixed_strategies()
+        seeds = np.random.SeedSequence().spawn(processes)
+        counts = [num_rounds // processes + (i < num_rounds % processes) for i in range(processes)]
+        
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(_simulate_batch, [(seed, n, payoff_matrix, hider_strategy, seeker_strategy)
+                                                 for seed, n in zip(seeds, counts)])
+        
+        total_payoff = sum(result[0] for result in results)
+        self.seeker_wins = sum(result[1] for result in results)
+        self.hider_wins = num_rounds - self.seeker_wins
+        self.total_payoff = total_payoff
+        self.rounds_played = num_rounds
+        self.game_logic.record_rounds(num_rounds, total_payoff, self.seeker_wins)
+        
+        return self.get_results()
+    
+    def advance(self, num_rounds):
+        """
+        Play a batch of rounds on top of the rounds already played.
+        
+        Args:
+            num_rounds (int): Number of rounds to simulate
             
-            if found:
-                self.seeker_wins += 1
-            else:
-                self.hider_wins += 1
-                
-            self.total_payoff += payoff
-            self.rounds_played += 1
+        Returns:
+            dict: Dictionary containing simulation results
+        """
+        _, _, payoffs, found = self.game_logic.play_rounds(num_rounds)
+        
+        seeker_wins = int(np.count_nonzero(found))
+        self.seeker_wins += seeker_wins
+        self.hider_wins += num_rounds - seeker_wins
+        self.total_payoff += payoffs.sum(dtype=np.float64)
+        self.rounds_played += num_rounds
         
         return self.get_results()
     
@@ -118,7 +171,9 @@ class Simulation:
                 'avg_payoff': 0,
                 'rounds_played': 0,
                 'hider_wins': 0,
-                'seeker_wins': 0
+                'seeker_wins': 0,
+                'hider_score': self.hider.score,
+                'seeker_score': self.seeker.score
             }
         
         return {
@@ -127,7 +182,9 @@ class Simulation:
             'avg_payoff': self.total_payoff / self.rounds_played,
             'rounds_played': self.rounds_played,
             'hider_wins': self.hider_wins,
-            'seeker_wins': self.seeker_wins
+            'seeker_wins': self.seeker_wins,
+            'hider_score': self.hider.score,
+            'seeker_score': self.seeker.score
         }
     
     def reset(self):
@@ -5,13 +5,274 @@ This module contains visualization-related methods for the Hide & Seek game UI.
 """
 
 from PyQt5.QtWidgets import (QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QGridLayout, 
-                            QGroupBox, QTableWidget, QTableWidgetItem,QWidget)
-from PyQt5.QtCore import Qt
+                            QGroupBox, QTableView, QWidget, QHeaderView, QStyledItemDelegate,
+                            QAbstractItemView)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QRectF
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen
 import numpy as np
 
 from player import PlayerType
 from world import World1D, World2D, PlaceType
 
+# Grid button styles, set once on the grid's group box and selected per button
+# through its "place", "selected" and "mark" properties
+GRID_STYLE = """
+    QPushButton {
+        background-color: #263238;
+        color: white;
+        border: 1px solid #1e88e5;
+        font-size: 20px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        border: 2px solid #2196f3;
+    }
+    QPushButton[place="EASY"] {
+        background-color: #4CAF50;  /* Green for easy */
+        color: white;
+    }
+    QPushButton[place="EASY"]:hover {
+        background-color: #388E3C;
+    }
+    QPushButton[place="NEUTRAL"] {
+        background-color: #FFC107;  /* Yellow for neutral */
+        color: black;
+    }
+    QPushButton[place="NEUTRAL"]:hover {
+        background-color: #FFA000;
+    }
+    QPushButton[place="HARD"] {
+        background-color: #F44336;  /* Red for hard */
+        color: white;
+    }
+    QPushButton[place="HARD"]:hover {
+        background-color: #D32F2F;
+    }
+    QPushButton[selected="true"] {
+        background-color: #263238;
+        color: white;
+        border: 3px solid #FFEB3B;  /* Bright yellow border for the selection */
+    }
+    QPushButton[mark="human"], QPushButton[mark="human"]:hover {
+        background-color: white;  /* White for human */
+        color: black;
+        border: 3px solid #E0E0E0;
+    }
+    QPushButton[mark="computer"], QPushButton[mark="computer"]:hover {
+        background-color: #2196F3;  /* Blue for computer */
+        color: white;
+        border: 3px solid #64B5F6;
+    }
+    QPushButton[mark="overlap"], QPushButton[mark="overlap"]:hover {
+        background-color: #212121;  /* Black for catch */
+        color: white;
+        border: 3px solid #757575;
+    }
+"""
+
+# Number of color levels in the probability views
+PROB_LEVELS = 16
+# Base color of each player's probability shading
+PROBABILITY_COLORS = {"hider": (33, 150, 243), "seeker": (244, 67, 54)}
+# Border color of each place type in the probability views
+PLACE_COLORS = {"EASY": "#4CAF50", "NEUTRAL": "#FFC107", "HARD": "#F44336"}
+# Side of a probability card in a 2D world's strategy table, and size of its headers
+CARD_SIZE = 80
+CARD_HEADER_WIDTH = 72
+CARD_HEADER_HEIGHT = 30
+
+def _probability_style():
+    """Build the probability view style sheet, with one rule per color level."""
+    rules = ["""
+    QLabel[cell="swatch"] { border: 1px solid #1e88e5; }
+    QLabel[cell="seeker-swatch"] { border: 1px solid #F44336; }
+    QLabel[cell="box"] { border: 1px solid #1e88e5; border-radius: 4px; }
+    QLabel[cell="sim-box"] { border: 2px solid; border-radius: 4px; }
+    QLabel[cell="type"] { color: white; border-radius: 2px; padding: 2px; }
+    QLabel[place="EASY"] { border-color: #4CAF50; }
+    QLabel[place="NEUTRAL"] { border-color: #FFC107; }
+    QLabel[place="HARD"] { border-color: #F44336; }
+    QLabel[cell="type"][place="EASY"] { background-color: #4CAF50; }
+    QLabel[cell="type"][place="NEUTRAL"] { background-color: #FFC107; color: black; }
+    QLabel[cell="type"][place="HARD"] { background-color: #F44336; }
+    QTableView[cell="cards"] { background-color: transparent; border: none; }
+    QTableView[cell="cards"] QHeaderView::section,
+    QTableView[cell="cards"] QTableCornerButton::section {
+        background-color: transparent;
+        border: none;
+        color: #1e88e5;
+        font-weight: bold;
+    }
+    """]
+    for level in range(PROB_LEVELS):
+        alpha = level / (PROB_LEVELS - 1)
+        for shade, (r, g, b) in PROBABILITY_COLORS.items():
+            rules.append(f'QLabel[{shade}="{level}"] {{ background-color: rgba({r}, {g}, {b}, {alpha:.3f}); }}')
+    return "\n".join(rules)
+
+# Probability cell styles, set once on the strategy group box and selected per
+# label through its "cell", "place", "hider" and "seeker" properties
+PROBABILITY_STYLE = _probability_style()
+
+def probability_level(intensity):
+    """
+    Get the color level of a probability intensity.
+    
+    Args:
+        intensity (float): Probability relative to the largest one, from 0 to 1
+        
+    Returns:
+        int: Level from 0 to PROB_LEVELS - 1
+    """
+    return int(round(intensity * (PROB_LEVELS - 1)))
+
+def probability_levels(probabilities):
+    """
+    Get the color level of every probability of a strategy at once.
+    
+    Args:
+        probabilities (np.ndarray): Probability of each position
+        
+    Returns:
+        list: Level from 0 to PROB_LEVELS - 1 of each probability, relative to the largest one
+    """
+    probabilities = np.asarray(probabilities, dtype=float)
+    max_prob = probabilities.max() if probabilities.size else 0.0
+    if max_prob <= 0:
+        return [0] * probabilities.size
+    return np.rint(probabilities / max_prob * (PROB_LEVELS - 1)).astype(int).tolist()
+
+class PayoffModel(QAbstractTableModel):
+    """Table model that shows the payoff matrix without copying it into table items."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._matrix = np.zeros((0, 0))
+        self._cols = None
+        # Text of each distinct payoff, and the index of each cell's text
+        self._labels = []
+        self._codes = np.zeros((0, 0), dtype=np.intp)
+
+    def set_matrix(self, matrix, cols=None):
+        """
+        Replace the displayed payoff matrix.
+
+        Args:
+            matrix (np.ndarray): Square payoff matrix
+            cols (int): Number of grid columns for a 2D world, None for 1D
+        """
+        self.beginResetModel()
+        self._matrix = matrix
+        self._cols = cols
+        # A payoff matrix holds only a few distinct values, so they are formatted once
+        values, codes = np.unique(matrix, return_inverse=True)
+        self._labels = np.char.mod("%g", values).tolist()
+        self._codes = codes.reshape(matrix.shape)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._matrix.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._matrix.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._labels[self._codes[index.row(), index.column()]]
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or section >= self._matrix.shape[0]:
+            return None
+        if self._cols is None:
+            return f"Pos {section}"
+        r, c = divmod(section, self._cols)
+        return f"({r},{c})"
+
+class ProbabilityModel(QAbstractTableModel):
+    """Table model that shows a 2D world's strategy as one card per position."""
+
+    # Role holding the place type name of a cell, for ProbabilityDelegate
+    PlaceRole = Qt.UserRole
+
+    def __init__(self, probabilities, places, cols, shade="hider", parent=None):
+        """
+        Initialize the model.
+
+        Args:
+            probabilities (np.ndarray): Probability of each position in flat index order
+            places (list): PlaceType of each position in flat index order
+            cols (int): Number of grid columns
+            shade (str): Key of PROBABILITY_COLORS used for the cell backgrounds
+            parent (QObject): Parent object
+        """
+        super().__init__(parent)
+        probabilities = np.asarray(probabilities, dtype=float)
+        self._cols = cols
+        self._rows = probabilities.size // cols
+        max_prob = float(probabilities.max()) if probabilities.size else 1.0
+        intensity = probabilities / max_prob if max_prob > 0 else np.zeros_like(probabilities)
+        
+        # Everything a cell shows is computed once, data() only looks it up
+        self._places = [place.name for place in places]
+        self._labels = [f"{prob}\n{place[0]}" for prob, place
+                        in zip(np.char.mod("%.4f", probabilities).tolist(), self._places)]
+        r, g, b = PROBABILITY_COLORS[shade]
+        colors = [QColor(r, g, b, round(255 * level / (PROB_LEVELS - 1))) for level in range(PROB_LEVELS)]
+        self._backgrounds = [colors[level] for level in probability_levels(probabilities)]
+        # Light text on dark backgrounds
+        light, dark = QColor("white"), QColor("#121212")
+        self._foregrounds = [light if value > 0.3 else dark for value in intensity.tolist()]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._cols
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        i = index.row() * self._cols + index.column()
+        if role == Qt.DisplayRole:
+            return self._labels[i]
+        if role == Qt.BackgroundRole:
+            return self._backgrounds[i]
+        if role == Qt.ForegroundRole:
+            return self._foregrounds[i]
+        if role == self.PlaceRole:
+            return self._places[i]
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        return f"Col {section}" if orientation == Qt.Horizontal else f"Row {section}"
+
+class ProbabilityDelegate(QStyledItemDelegate):
+    """Paints a ProbabilityModel cell as a rounded card bordered with its place type color."""
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(PLACE_COLORS[index.data(ProbabilityModel.PlaceRole)]), 3))
+        painter.setBrush(index.data(Qt.BackgroundRole))
+        painter.drawRoundedRect(QRectF(option.rect).adjusted(2.5, 2.5, -2.5, -2.5), 8, 8)
+        
+        font = QFont(option.font)
+        font.setBold(True)
+        font.setPixelSize(16)
+        painter.setFont(font)
+        painter.setPen(index.data(Qt.ForegroundRole))
+        painter.drawText(option.rect, Qt.AlignCenter, index.data())
+        painter.restore()
+
 class GameVisualization:
     """Handles visualization methods for the Hide & Seek game UI."""
     
@@ -28,16 +289,18 @@ class GameVisualization:
         
         # World grid
         self.world_grid = QGridLayout()
+        # Grid buttons in flat position index order, for both world types
         self.world_buttons = []
         
-        # Placeholder for the world grid
-        placeholder = QLabel("Initialize the game to see the world")
-        placeholder.setAlignment(Qt.AlignCenter)
-        self.world_grid.addWidget(placeholder, 0, 0)
+        # Placeholder for the world grid, kept and hidden while a world is shown
+        self.grid_placeholder = QLabel("Initialize the game to see the world")
+        self.grid_placeholder.setAlignment(Qt.AlignCenter)
+        self.world_grid.addWidget(self.grid_placeholder, 0, 0)
         
         visual_layout.addLayout(self.world_grid)
         
         visual_group.setLayout(visual_layout)
+        visual_group.setStyleSheet(GRID_STYLE)
         
         # Directly add to parent layout
         if isinstance(parent_layout, QWidget):
@@ -78,13 +341,14 @@ class GameVisualization:
             intensity = i / 9.0  # 0.0 to 1.0
             color_box = QLabel()
             color_box.setFixedSize(20, 20)
-            color_box.setStyleSheet(f"background-color: rgba(33, 150, 243, {intensity});")
+            self.set_label_style(color_box, hider=probability_level(intensity))
             legend_layout.addWidget(color_box)
         
         legend_layout.addWidget(QLabel("High"))
         strategy_layout.addLayout(legend_layout)
         
         strategy_group.setLayout(strategy_layout)
+        strategy_group.setStyleSheet(PROBABILITY_STYLE)
         
         # Check if parent_layout is a QWidget or QLayout
         if isinstance(parent_layout, QWidget):
@@ -110,7 +374,12 @@ class GameVisualization:
         explanation.setWordWrap(True)
 
         # Payoff matrix visualization
-        self.payoff_table = QTableWidget()
+        self.payoff_model = PayoffModel()
+        self.payoff_table = QTableView()
+        self.payoff_table.setModel(self.payoff_model)
+        # Fixed cell sizes, so Qt never measures the cell texts
+        self.payoff_table.horizontalHeader().setDefaultSectionSize(60)
+        self.payoff_table.verticalHeader().setDefaultSectionSize(24)
 
         # Create a vertical layout for this section
         section_layout = QVBoxLayout()
@@ -135,72 +404,76 @@ class GameVisualization:
     
     def update_world_grid(self):
         """Update the world grid visualization."""
-        # Clear existing grid
-        for i in reversed(range(self.world_grid.count())):
-            self.world_grid.itemAt(i).widget().deleteLater()
-            
-        # Create new grid
-        self.world_buttons = []
-        
-        # Base button style
-        button_style = """
-            QPushButton {
-                background-color: #263238;
-                color: white;
-                border: 1px solid #1e88e5;
-                font-size: 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                border: 2px solid #2196f3;
-            }
-        """
+        self.marked_positions = []
         
         if not self.world:
-            # Create empty placeholder
-            placeholder = QLabel("Create a world first")
-            placeholder.setAlignment(Qt.AlignCenter)
-            self.world_grid.addWidget(placeholder, 0, 0)
+            self.clear_world_grid()
+            # Show the placeholder again
+            self.grid_placeholder.setText("Create a world first")
+            self.grid_placeholder.show()
             return
-            
+        self.grid_placeholder.hide()
+        
         if isinstance(self.world, World1D):
-            # Create 1D grid
-            for i in range(self.world.size):
+            shape = (self.world.size,)
+        else:
+            shape = (self.world.rows, self.world.cols)
+        
+        grid_widget = self.world_grid.parentWidget()
+        grid_widget.setUpdatesEnabled(False)
+        
+        if getattr(self, 'grid_shape', None) == shape:
+            # Same shape: reuse the buttons, clearing what the previous game left on them
+            self.reset_all_buttons_to_base_style()
+        else:
+            self.clear_world_grid()
+            self.grid_shape = shape
+            
+            # Create the grid, a 1D world is a single row
+            cols = shape[-1]
+            for index in range(self.world.size):
                 btn = QPushButton()
                 btn.setFixedSize(60, 60)  # Increased button size
-                btn.setStyleSheet(button_style)
-                btn.setText("")  # Ensure empty text initially
-                btn.setToolTip(f"Position {i}")
-                # Connect button click to make_move
-                btn.clicked.connect(lambda checked, i=i: self.handle_button_click(i))
+                btn.setToolTip(f"Position {self.world.index_to_pos(index)}")
+                # All buttons share one slot, which reads the position back from the button
+                btn.setProperty("pos_index", index)
+                btn.clicked.connect(self.on_cell_clicked)
                 
-                self.world_grid.addWidget(btn, 0, i)
+                self.world_grid.addWidget(btn, *divmod(index, cols))
                 self.world_buttons.append(btn)
-                
-        elif isinstance(self.world, World2D):
-            rows = self.world.rows
-            cols = self.world.cols
             
-            # Create 2D grid
-            for r in range(rows):
-                row_buttons = []
-                for c in range(cols):
-                    btn = QPushButton()
-                    btn.setFixedSize(60, 60)  # Increased button size
-                    btn.setStyleSheet(button_style)
-                    btn.setText("")  # Ensure empty text initially
-                    btn.setToolTip(f"Position ({r}, {c})")
-                    # Connect button click to make_move
-                    btn.clicked.connect(lambda checked, r=r, c=c: self.handle_button_click((r, c)))
-                    
-                    self.world_grid.addWidget(btn, r, c)
-                    row_buttons.append(btn)
-                self.world_buttons.append(row_buttons)
-        
-        # Apply place type colors to buttons
-        self.apply_place_type_colors()
+            # Apply place type colors to buttons
+            self.apply_place_type_colors()
+        
         # Highlight available positions based on player type
         self.highlight_positions()
+        
+        grid_widget.setUpdatesEnabled(True)
+    
+    def on_cell_clicked(self):
+        """Forward a grid button click to handle_button_click with the button's position."""
+        index = self.sender().property("pos_index")
+        self.handle_button_click(self.world.index_to_pos(index))
+    
+    def clear_world_grid(self):
+        """Delete the grid buttons, keeping the placeholder."""
+        for i in reversed(range(self.world_grid.count())):
+            widget = self.world_grid.itemAt(i).widget()
+            if widget is not self.grid_placeholder:
+                self.world_grid.removeWidget(widget)
+                widget.deleteLater()
+        self.world_buttons = []
+        self.selected_button = None
+        self.grid_shape = None
+    
+    def clear_probability_grid(self):
+        """Remove the strategy view, so that the next update rebuilds it."""
+        for i in reversed(range(self.probability_grid.count())):
+            item = self.probability_grid.itemAt(i)
+            if item.widget():
+                item.widget().deleteLater()
+        self.probability_view = None
+        self.sim_probability_view = None
     
     def update_payoff_matrix(self):
         """Update the payoff matrix visualization."""
@@ -210,112 +483,32 @@ class GameVisualization:
         # Generate payoff matrix
         payoff_matrix = self.world.get_payoff_matrix()
         
-        # Clear the table
-        self.payoff_table.clear()
+        # Table dimensions based on the world type
         size = 0
-        # Set table dimensions based on the world type
+        cols = None
         if isinstance(self.world, World1D):
             size = self.world.size
-            self.payoff_table.setRowCount(size)
-            self.payoff_table.setColumnCount(size)
-            
-            # Set headers
-            headers = [f"Pos {i}" for i in range(size)]
-            self.payoff_table.setHorizontalHeaderLabels(headers)
-            self.payoff_table.setVerticalHeaderLabels(headers)
-            
-            # Fill the table with payoff values
-            for h in range(size):
-                for s in range(size):
-                    payoff = payoff_matrix[h][s]
-                    item = QTableWidgetItem(str(payoff))
-                    item.setTextAlignment(Qt.AlignCenter)
-                    self.payoff_table.setItem(h, s, item)
-                    
         elif isinstance(self.world, World2D):
-            rows = self.world.rows
-            cols = self.world.cols
-            
             # In 2D world, the payoff matrix is (rows*cols) x (rows*cols)
-            total_positions = rows * cols
-            size = total_positions
-            self.payoff_table.setRowCount(total_positions)
-            self.payoff_table.setColumnCount(total_positions)
-            
-            # Set headers
-            h_headers = []
-            for r in range(rows):
-                for c in range(cols):
-                    h_headers.append(f"({r},{c})")
-            
-            self.payoff_table.setHorizontalHeaderLabels(h_headers)
-            self.payoff_table.setVerticalHeaderLabels(h_headers)
-            
-            # Fill the table with payoff values
-            for h in range(total_positions):
-                for s in range(total_positions):
-                    payoff = payoff_matrix[h][s]
-                    item = QTableWidgetItem(str(payoff))
-                    item.setTextAlignment(Qt.AlignCenter)
-                    self.payoff_table.setItem(h, s, item)
-        
-        # Auto-adjust columns to content
-        self.payoff_table.resizeColumnsToContents()
-        self.payoff_table.resizeRowsToContents()
-
+            size = self.world.rows * self.world.cols
+            cols = self.world.cols
+        
+        # The model reads the values and labels when the cells are painted
+        self.payoff_model.set_matrix(payoff_matrix, cols)
+        
         # Set table size
         self.payoff_table.setFixedSize(self.payoff_table.horizontalHeader().length() + size * 12,
                                        self.payoff_table.verticalHeader().length() + size * 12)
         
-        # Make sure table is visible
-        self.payoff_table.show()
-        self.payoff_table.setVisible(True)
-        
-        # Make sure the parent is also visible
-        if hasattr(self, 'payoff_content_layout'):
-            parent_widget = self.payoff_content_layout.parentWidget()
-            if parent_widget:
-                parent_widget.show()
-                parent_widget.setVisible(True)
-        
-        # Switch to the payoff tab to ensure it's rendered
-        self.tab_widget.setCurrentIndex(2)  # Index 2 is the payoff tab
-        # Switch back to the game board tab
-        self.tab_widget.setCurrentIndex(0)
-        
-        # Update strategy for computer player
-        strategy = self.lp_solver.solve_game(payoff_matrix, self.computer_player.type)
-        self.computer_player.set_strategy(strategy)
+        # The payoff tab is painted when it is opened
+        self.payoff_table.viewport().update()
 
     def show_selection_feedback(self, position):
         """Show visual feedback for the selected position."""
         self.selected_position = position
         
-        # Define the selected style - bright yellow border to highlight
-        selected_style = """
-            QPushButton {
-                background-color: #263238;
-                color: white;
-                border: 3px solid #FFEB3B;
-                font-size: 20px;
-                font-weight: bold;
-            }
-        """
-        
-        # Apply style based on world type
-        if isinstance(self.world, World1D):
-            # Store current text before changing style
-            current_text = self.world_buttons[position].text()
-            self.world_buttons[position].setStyleSheet(selected_style)
-            # Restore text
-            self.world_buttons[position].setText(current_text)
-        elif isinstance(self.world, World2D):
-            row, col = position
-            # Store current text before changing style
-            current_text = self.world_buttons[row][col].text() 
-            self.world_buttons[row][col].setStyleSheet(selected_style)
-            # Restore text
-            self.world_buttons[row][col].setText(current_text)
+        # The selected rule of GRID_STYLE draws the highlight
+        self.select_button(self.get_button(position))
             
         # Show position info
         self.show_position_info(position)
@@ -323,44 +516,20 @@ class GameVisualization:
     def show_position_info(self, position):
         """Display information about the selected position."""
         # Get place type
+        place_type = self.world.get_place_type(position)
         if isinstance(self.world, World1D):
-            place_type = self.world.get_place_type(position)
             pos_str = f"Position {position}"
-            
-            # Get expected payoff for this position
-            payoff_text = ""
-            if self.human_player.type == PlayerType.HIDER:
-                payoffs = [self.world.get_score(position, j) for j in range(self.world.size)]
-                avg_payoff = sum(payoffs) / len(payoffs)
-                payoff_text = f"Avg Payoff: {avg_payoff:.2f}"
-            else:  # SEEKER
-                payoffs = [self.world.get_score(i, position) for i in range(self.world.size)]
-                avg_payoff = sum(payoffs) / len(payoffs)
-                payoff_text = f"Avg Payoff: {avg_payoff:.2f}"
-                
         else:  # 2D
             row, col = position
-            place_type = self.world.get_place_type(position)
             pos_str = f"Position ({row}, {col})"
-            
-            # Get expected payoff for this position (2D)
-            payoff_text = ""
-            if self.human_player.type == PlayerType.HIDER:
-                payoffs = []
-                for r in range(self.world.rows):
-                    for c in range(self.world.cols):
-                        seeker_pos = (r, c)
-                        payoffs.append(self.world.get_score(position, seeker_pos))
-                avg_payoff = sum(payoffs) / len(payoffs)
-                payoff_text = f"Avg Payoff: {avg_payoff:.2f}"
-            else:  # SEEKER
-                payoffs = []
-                for r in range(self.world.rows):
-                    for c in range(self.world.cols):
-                        hider_pos = (r, c)
-                        payoffs.append(self.world.get_score(hider_pos, position))
-                avg_payoff = sum(payoffs) / len(payoffs)
-                payoff_text = f"Avg Payoff: {avg_payoff:.2f}"
+        
+        # Expected payoff for this position against every opponent position
+        index = self.world.pos_to_index(position)
+        if self.human_player.type == PlayerType.HIDER:
+            avg_payoff = self.world.hider_avg_payoff[index]
+        else:  # SEEKER
+            avg_payoff = self.world.seeker_avg_payoff[index]
+        payoff_text = f"Avg Payoff: {avg_payoff:.2f}"
             
         # Determine place type description
         if place_type == PlaceType.EASY:
@@ -379,239 +548,203 @@ class GameVisualization:
         if not self.world:
             return
             
-        # Reset to base styles first
-        self.reset_all_buttons_to_base_style()
+        # Only the cells restyled for the previous round need resetting
+        grid_widget = self.world_grid.parentWidget()
+        grid_widget.setUpdatesEnabled(False)
+        self.reset_marked_buttons()
         
         # Re-apply selection highlight if there's a selected position
         if hasattr(self, 'selected_position') and self.selected_position is not None and not hasattr(self, 'simulation_active'):
             self.show_selection_feedback(self.selected_position)
-            
-        # Define highlight styles
-        human_style = """
-            QPushButton {
-                background-color: white;  /* White for human */
-                color: black;
-                border: 3px solid #E0E0E0;
-                font-weight: bold;
-                font-size: 20px;  /* Larger text */
-            }
-        """
-        
-        computer_style = """
-            QPushButton {
-                background-color: #2196F3;  /* Blue for computer */
-                color: white;
-                border: 3px solid #64B5F6;
-                font-weight: bold;
-                font-size: 20px;  /* Larger text */
-            }
-        """
-        
-        overlap_style = """
-            QPushButton {
-                background-color: #212121;  /* Black for catch */
-                color: white;
-                border: 3px solid #757575;
-                font-weight: bold;
-                font-size: 20px;  /* Larger text */
-            }
-        """
         
         # Get current positions
         if self.game_logic:
             hider_pos = self.game_logic.get_hider_position()
             seeker_pos = self.game_logic.get_seeker_position()
+            if hider_pos is not None:
+                hider_pos = self.world.index_to_pos(hider_pos)
+            if seeker_pos is not None:
+                seeker_pos = self.world.index_to_pos(seeker_pos)
             
             # Determine which positions belong to human and computer players (or hider/seeker in simulation)
             if hasattr(self, 'simulation_active') and self.simulation_active:
                 # In simulation mode, highlight hider and seeker positions directly
-                positions_overlap = (hider_pos is not None and seeker_pos is not None and hider_pos == seeker_pos)
-                
-                # Apply styles based on world type
-                if isinstance(self.world, World1D):
-                    # Check for overlap first
-                    if positions_overlap and hider_pos is not None and 0 <= hider_pos < len(self.world_buttons):
-                        self.world_buttons[hider_pos].setStyleSheet(overlap_style)
-                        self.world_buttons[hider_pos].setText("X")  # X symbol for overlap
-                    else:
-                        # Apply styles for individual positions
-                        if hider_pos is not None and 0 <= hider_pos < len(self.world_buttons):
-                            self.world_buttons[hider_pos].setStyleSheet(human_style)
-                            self.world_buttons[hider_pos].setText("H")  # H for hider
-                            
-                        if seeker_pos is not None and 0 <= seeker_pos < len(self.world_buttons):
-                            self.world_buttons[seeker_pos].setStyleSheet(computer_style)
-                            self.world_buttons[seeker_pos].setText("S")  # S for seeker
-                    
-                elif isinstance(self.world, World2D):
-                    # Check for overlap first
-                    if positions_overlap and hider_pos is not None:
-                        h_row, h_col = hider_pos
-                        if 0 <= h_row < len(self.world_buttons) and 0 <= h_col < len(self.world_buttons[h_row]):
-                            self.world_buttons[h_row][h_col].setStyleSheet(overlap_style)
-                            self.world_buttons[h_row][h_col].setText("X")  # X symbol for overlap
-                    else:
-                        # Apply styles for individual positions
-                        if hider_pos is not None:
-                            h_row, h_col = hider_pos
-                            if 0 <= h_row < len(self.world_buttons) and 0 <= h_col < len(self.world_buttons[h_row]):
-                                self.world_buttons[h_row][h_col].setStyleSheet(human_style)
-                                self.world_buttons[h_row][h_col].setText("H")  # H for hider
-                                
-                        if seeker_pos is not None:
-                            s_row, s_col = seeker_pos
-                            if 0 <= s_row < len(self.world_buttons) and 0 <= s_col < len(self.world_buttons[s_row]):
-                                self.world_buttons[s_row][s_col].setStyleSheet(computer_style)
-                                self.world_buttons[s_row][s_col].setText("S")  # S for seeker
-            else:
+                first_pos, first_text = hider_pos, "H"  # H for hider
+                second_pos, second_text = seeker_pos, "S"  # S for seeker
+            elif self.human_player.type == PlayerType.HIDER:
                 # Normal game mode - use human/computer distinction
-                human_pos = None
-                computer_pos = None
-                
-                if self.human_player.type == PlayerType.HIDER:
-                    human_pos = hider_pos
-                    computer_pos = seeker_pos
-                else:
-                    human_pos = seeker_pos
-                    computer_pos = hider_pos
-                
-                # Check if positions overlap (same position chosen by both players)
-                positions_overlap = (hider_pos is not None and seeker_pos is not None and hider_pos == seeker_pos)
-                
-                # Apply styles based on world type
-                if isinstance(self.world, World1D):
-                    # Check for overlap first
-                    if positions_overlap and 0 <= human_pos < len(self.world_buttons):
-                        self.world_buttons[human_pos].setStyleSheet(overlap_style)
-                        self.world_buttons[human_pos].setText("X")  # X symbol for overlap
-                    else:
-                        # Apply styles for individual positions
-                        if human_pos is not None and 0 <= human_pos < len(self.world_buttons):
-                            self.world_buttons[human_pos].setStyleSheet(human_style)
-                            self.world_buttons[human_pos].setText("H")  # H for human
-                            
-                        if computer_pos is not None and 0 <= computer_pos < len(self.world_buttons):
-                            self.world_buttons[computer_pos].setStyleSheet(computer_style)
-                            self.world_buttons[computer_pos].setText("C")  # C for computer
-                    
-                elif isinstance(self.world, World2D):
-                    # Check for overlap first
-                    if positions_overlap:
-                        h_row, h_col = human_pos
-                        if 0 <= h_row < len(self.world_buttons) and 0 <= h_col < len(self.world_buttons[h_row]):
-                            self.world_buttons[h_row][h_col].setStyleSheet(overlap_style)
-                            self.world_buttons[h_row][h_col].setText("X")  # X symbol for overlap
-                    else:
-                        # Apply styles for individual positions
-                        if human_pos is not None:
-                            h_row, h_col = human_pos
-                            if 0 <= h_row < len(self.world_buttons) and 0 <= h_col < len(self.world_buttons[h_row]):
-                                self.world_buttons[h_row][h_col].setStyleSheet(human_style)
-                                self.world_buttons[h_row][h_col].setText("H")  # H for human
-                                
-                        if computer_pos is not None:
-                            c_row, c_col = computer_pos
-                            if 0 <= c_row < len(self.world_buttons) and 0 <= c_col < len(self.world_buttons[c_row]):
-                                self.world_buttons[c_row][c_col].setStyleSheet(computer_style)
-                                self.world_buttons[c_row][c_col].setText("C")  # C for computer
+                first_pos, first_text = hider_pos, "H"  # H for human
+                second_pos, second_text = seeker_pos, "C"  # C for computer
+            else:
+                first_pos, first_text = seeker_pos, "H"  # H for human
+                second_pos, second_text = hider_pos, "C"  # C for computer
+            
+            # Check if positions overlap (same position chosen by both players)
+            positions_overlap = (hider_pos is not None and seeker_pos is not None and hider_pos == seeker_pos)
+            
+            if positions_overlap:
+                self.mark_button(first_pos, "overlap", "X")  # X symbol for overlap
+            else:
+                self.mark_button(first_pos, "human", first_text)
+                self.mark_button(second_pos, "computer", second_text)
+        
+        grid_widget.setUpdatesEnabled(True)
     
-    def apply_place_type_colors(self):
-        """Apply colors to grid buttons based on place types."""
-        if not self.world:
-            return
+    def get_button(self, position):
+        """
+        Get the grid button at a position.
+        
+        Args:
+            position (int or tuple): Position in the world
             
-        # Define place type styles
-        easy_style = """
-            QPushButton {
-                background-color: #4CAF50;  /* Green for easy */
-                color: white;
-                border: 1px solid #1e88e5;
-                font-size: 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #388E3C;
-                border: 2px solid #2196f3;
-            }
+        Returns:
+            QPushButton: The button, or None if the position is outside the grid
         """
+        if position is None:
+            return None
+        index = self.world.pos_to_index(position)
+        if 0 <= index < len(self.world_buttons):
+            return self.world_buttons[index]
+        return None
+    
+    def mark_button(self, position, mark, text=""):
+        """
+        Restyle the button at a position and remember it for the next reset.
         
-        neutral_style = """
-            QPushButton {
-                background-color: #FFC107;  /* Yellow for neutral */
-                color: black;
-                border: 1px solid #1e88e5;
-                font-size: 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #FFA000;
-                border: 2px solid #2196f3;
-            }
+        Args:
+            position (int or tuple): Position in the world
+            mark (str): GRID_STYLE mark to apply ("human", "computer" or "overlap")
+            text (str): Text to show on the button
         """
+        button = self.get_button(position)
+        if button is None:
+            return
+        self.set_button_mark(button, mark)
+        button.setText(text)
+        self.marked_positions.append(position)
+    
+    def set_button_mark(self, button, mark):
+        """
+        Select the GRID_STYLE mark rule of a button, or clear it with "".
         
-        hard_style = """
-            QPushButton {
-                background-color: #F44336;  /* Red for hard */
-                color: white;
-                border: 1px solid #1e88e5;
-                font-size: 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #D32F2F;
-                border: 2px solid #2196f3;
-            }
+        Args:
+            button (QPushButton): Grid button
+            mark (str): Mark to apply
+        """
+        if (button.property("mark") or "") != mark:
+            button.setProperty("mark", mark)
+            # Re-evaluate the property selectors for this button
+            button.style().unpolish(button)
+            button.style().polish(button)
+    
+    def create_probability_table(self, probabilities, shade="hider"):
         """
+        Create a table showing a 2D world's strategy, with one painted card per position.
         
-        # Store the original styles for each button
-        if not hasattr(self, 'button_styles'):
-            self.button_styles = {}
+        A single view replaces a label per cell, and only the visible cards are painted.
         
-        # Apply styles based on world type
-        if isinstance(self.world, World1D):
-            for i in range(self.world.size):
-                place_type = self.world.get_place_type(i)
-                if place_type == PlaceType.EASY:
-                    style = easy_style
-                elif place_type == PlaceType.NEUTRAL:
-                    style = neutral_style
-                else:  # HARD
-                    style = hard_style
-                    
-                self.button_styles[i] = style
-                self.world_buttons[i].setStyleSheet(style)
-                # Preserve any text on the button
-                
-        elif isinstance(self.world, World2D):
-            for r in range(self.world.rows):
-                for c in range(self.world.cols):
-                    place_type = self.world.get_place_type((r, c))
-                    if place_type == PlaceType.EASY:
-                        style = easy_style
-                    elif place_type == PlaceType.NEUTRAL:
-                        style = neutral_style
-                    else:  # HARD
-                        style = hard_style
-                        
-                    self.button_styles[(r, c)] = style
-                    self.world_buttons[r][c].setStyleSheet(style)
-                    # Preserve any text on the button
+        Args:
+            probabilities (np.ndarray): Probability of each position in flat index order
+            shade (str): Key of PROBABILITY_COLORS used for the cards
+            
+        Returns:
+            QTableView: The table, sized to show every card
+        """
+        table = QTableView()
+        table.setModel(ProbabilityModel(probabilities, self.world.flat_places(), self.world.cols, shade, table))
+        table.setItemDelegate(ProbabilityDelegate(table))
+        table.setProperty("cell", "cards")
+        table.setShowGrid(False)
+        table.setSelectionMode(QAbstractItemView.NoSelection)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setFocusPolicy(Qt.NoFocus)
+        table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        for header in (table.horizontalHeader(), table.verticalHeader()):
+            header.setSectionResizeMode(QHeaderView.Fixed)
+            header.setDefaultSectionSize(CARD_SIZE)
+        table.verticalHeader().setFixedWidth(CARD_HEADER_WIDTH)
+        table.verticalHeader().setDefaultAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        table.horizontalHeader().setFixedHeight(CARD_HEADER_HEIGHT)
+        
+        # The style sheet removes the frame, so the headers and cards fill the table
+        table.setFixedSize(CARD_HEADER_WIDTH + self.world.cols * CARD_SIZE,
+                           CARD_HEADER_HEIGHT + self.world.rows * CARD_SIZE)
+        return table
     
-    def reset_all_buttons_to_base_style(self):
-        """Reset all buttons to their base style based on place type."""
-        if not hasattr(self, 'button_styles'):
-            self.apply_place_type_colors()
+    def set_label_style(self, label, **properties):
+        """
+        Select the PROBABILITY_STYLE rules of a new label through its properties.
+        
+        Args:
+            label (QLabel): Label that is not shown yet
+            **properties: Property values, e.g. cell="box", place="EASY", hider=3
+        """
+        for name, value in properties.items():
+            label.setProperty(name, str(value).lower() if isinstance(value, bool) else str(value))
+    
+    def select_button(self, button):
+        """
+        Move the selection highlight to a grid button.
+        
+        Args:
+            button (QPushButton): Button to select, or None to clear the selection
+        """
+        for btn, selected in ((getattr(self, 'selected_button', None), False), (button, True)):
+            if btn is not None:
+                btn.setProperty("selected", selected)
+                # Re-evaluate the property selectors for this button
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
+        self.selected_button = button
+    
+    def reset_marked_buttons(self):
+        """Reset only the buttons restyled since the last reset to their place type style."""
+        self.select_button(None)
+        for position in getattr(self, 'marked_positions', []):
+            button = self.get_button(position)
+            if button is not None:
+                self.set_button_mark(button, "")  # Back to the place type rule of GRID_STYLE
+                button.setText("")  # Clear text
+        self.marked_positions = []
+    
+    def set_button_place(self, button, place_type):
+        """
+        Select the GRID_STYLE rule of a button by its place type.
+        
+        Args:
+            button (QPushButton): Grid button
+            place_type (PlaceType): Type of the place the button shows
+        """
+        if button.property("mark"):
+            self.set_button_mark(button, "")
+        if button.property("place") != place_type.name:
+            button.setProperty("place", place_type.name)
+            # Re-evaluate the property selectors for this button
+            button.style().unpolish(button)
+            button.style().polish(button)
+    
+    def apply_place_type_colors(self):
+        """Apply colors to grid buttons based on place types."""
+        if not self.world:
             return
             
-        if isinstance(self.world, World1D):
-            for i in range(self.world.size):
-                if i < len(self.world_buttons):
-                    self.world_buttons[i].setStyleSheet(self.button_styles[i])
-                    self.world_buttons[i].setText("")  # Clear text
-                
-        elif isinstance(self.world, World2D):
-            for r in range(self.world.rows):
-                for c in range(self.world.cols):
-                    if r < len(self.world_buttons) and c < len(self.world_buttons[r]):
-                        self.world_buttons[r][c].setStyleSheet(self.button_styles[(r, c)])
-                        self.world_buttons[r][c].setText("")  # Clear text
\ No newline at end of file
+        # Text on the buttons is preserved
+        for button, place_type in zip(self.world_buttons, self.world.flat_places()):
+            self.set_button_place(button, place_type)
+    
+    def reset_all_buttons_to_base_style(self):
+        """Reset all buttons to their base style based on place type."""
+        # Repaint the grid once when done, unless the caller is already batching updates
+        grid_widget = self.world_grid.parentWidget()
+        updates_enabled = grid_widget.updatesEnabled()
+        grid_widget.setUpdatesEnabled(False)
+        
+        self.marked_positions = []
+        self.select_button(None)
+        self.apply_place_type_colors()
+        for button in self.world_buttons:
+            if button.text():
+                button.setText("")  # Clear text
+        
+        grid_widget.setUpdatesEnabled(updates_enabled)
@@ -9,6 +9,7 @@ import random
 import numpy as np
 from enum import Enum
 from player import PlayerType
+from lp_solver import LPSolver
 
 class PlaceType(Enum):
     """Enumeration for different types of places in the world."""
@@ -28,6 +29,15 @@ class BaseWorld:
         """
         self.human_choice = human_choice
         self.use_proximity = use_proximity
+        self.strategies = {}
+
+    def pos_to_index(self, position):
+        """Convert a position to its flat index."""
+        return position
+
+    def index_to_pos(self, index):
+        """Convert a flat index to its position."""
+        return index
 
     def get_place_type(self, position):
         """Get the type of place at the given position."""
@@ -38,13 +48,68 @@ class BaseWorld:
         raise NotImplementedError("Subclasses must implement this method")
 
     def generate_payoff_matrix(self):
-        """Generate the game payoff matrix from the hider's perspective."""
+        """
+        Generate the game payoff matrix from the hider's perspective.
+        
+        All pairs of positions are scored at once with NumPy, with the same
+        rules as the per-pair loop they replace.
+        
+        Returns:
+            np.ndarray: The payoff matrix, filled in place
+        """
+        self.strategies.clear()
+        places = np.array([place.value for place in self.flat_places()], dtype=np.int8)
+        found = np.eye(self.size, dtype=bool)
+        
+        # The human loses the round when hiding and found, or seeking and not finding
+        score = np.where(found == (self.human_choice == PlayerType.HIDER), -1.0, 1.0)
+        # Rows are hider positions
+        score[~found & (places == PlaceType.EASY.value)[:, None]] *= 2
+        score[found & (places == PlaceType.HARD.value)[:, None]] *= 3
+        if self.use_proximity:
+            distance = self.position_distances()
+            score[distance == 1] *= 0.5
+            score[distance == 2] *= 0.75
+        
+        self.payoff_matrix[...] = score
+        # Average payoff of each position against every opponent position
+        self.hider_avg_payoff = score.mean(axis=1)
+        self.seeker_avg_payoff = score.mean(axis=0)
+        return self.payoff_matrix
+
+    def flat_places(self):
+        """Get the place type of every position in flat index order."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def position_distances(self):
+        """Get the distance between every pair of positions as a size x size array."""
         raise NotImplementedError("Subclasses must implement this method")
     
     def get_payoff_matrix(self):
         """Get the payoff matrix."""
         raise NotImplementedError("Subclasses must implement this method")
 
+    def get_strategy(self, player_type, lp_solver=None):
+        """
+        Get the optimal mixed strategy for a player on this world.
+        
+        One LP per payoff matrix gives both players' strategies; later calls
+        reuse them until the payoff matrix is regenerated.
+        
+        Args:
+            player_type (PlayerType): Type of player (HIDER or SEEKER)
+            lp_solver (LPSolver): Solver to use on a cache miss
+            
+        Returns:
+            np.ndarray: Probability distribution over positions
+        """
+        if player_type not in self.strategies:
+            solver = lp_solver if lp_solver is not None else LPSolver()
+            hider, seeker = solver.solve_both(self.get_payoff_matrix())
+            self.strategies[PlayerType.HIDER] = hider
+            self.strategies[PlayerType.SEEKER] = seeker
+        return self.strategies[player_type]
+
     def apply_proximity_score(self, base_score, hider_pos, seeker_pos):
         """
         Apply proximity score adjustment (Bonus feature).
@@ -77,7 +142,8 @@ class World1D(BaseWorld):
         super().__init__(human_choice, use_proximity)
         self.size = size
         self.places = [random.choice(list(PlaceType)) for _ in range(size)]
-        self.payoff_matrix = np.ones((size, size))
+        # Payoffs are small multiples of 0.25, which float32 stores exactly
+        self.payoff_matrix = np.ones((size, size), dtype=np.float32)
         self.generate_payoff_matrix()
 
     def get_place_type(self, position):
@@ -94,6 +160,15 @@ class World1D(BaseWorld):
             raise ValueError("Position out of bounds")
         return self.places[position]
 
+    def flat_places(self):
+        """Get the place type of every position in flat index order."""
+        return self.places
+
+    def position_distances(self):
+        """Get the distance between every pair of positions as a size x size array."""
+        index = np.arange(self.size)
+        return np.abs(index[:, None] - index[None, :])
+
     def get_score(self, hider_pos, seeker_pos):
         """
         Get the score for a given hider and seeker position.
@@ -110,28 +185,6 @@ class World1D(BaseWorld):
         score = self.payoff_matrix[hider_pos][seeker_pos]
         return score
 
-    def generate_payoff_matrix(self):
-        """
-        Generate the game payoff matrix from the hider's perspective.
-        
-        Returns:
-            list: 2D list representing the payoff matrix
-        """
-        for i in range(self.size):
-            for j in range(self.size):
-                score = 1
-                if (i == j and self.human_choice == PlayerType.HIDER) or (i != j and self.human_choice == PlayerType.SEEKER):
-                    score *= -1
-                if i != j and self.places[i] == PlaceType.EASY:
-                    score *= 2
-                if i == j and self.places[i] == PlaceType.HARD:
-                    score *= 3
-                if self.use_proximity:
-                    score = self.apply_proximity_score(score, i, j)
-
-                self.payoff_matrix[i][j] = score
-
-
     def get_payoff_matrix(self):
         """
         Get the payoff matrix.
@@ -182,7 +235,10 @@ class World2D(BaseWorld):
         self.cols = cols
         self.size = rows * cols
         self.places = [[random.choice(list(PlaceType)) for _ in range(cols)] for _ in range(rows)]
-        self.payoff_matrix = np.ones((self.size, self.size))
+        # (row, col) of every flat index
+        self.coords = np.stack(np.unravel_index(np.arange(self.size), (rows, cols)), axis=-1)
+        # Payoffs are small multiples of 0.25, which float32 stores exactly
+        self.payoff_matrix = np.ones((self.size, self.size), dtype=np.float32)
         self.generate_payoff_matrix()
 
     def pos_to_index(self, position):
@@ -192,7 +248,7 @@ class World2D(BaseWorld):
 
     def index_to_pos(self, index):
         """Convert 1D index to 2D position (row, col)."""
-        return divmod(index, self.cols)
+        return tuple(self.coords[index].tolist())
 
     def get_place_type(self, position):
         """
@@ -209,6 +265,14 @@ class World2D(BaseWorld):
             raise ValueError("Position out of bounds")
         return self.places[row][col]
 
+    def flat_places(self):
+        """Get the place type of every position in flat index order."""
+        return [place for row in self.places for place in row]
+
+    def position_distances(self):
+        """Get the Manhattan distance between every pair of positions as a size x size array."""
+        return np.abs(self.coords[:, None, :] - self.coords[None, :, :]).sum(axis=-1)
+
     def get_score(self, hider_pos, seeker_pos):
         """
         Get the score for a given hider and seeker position.
@@ -229,27 +293,6 @@ class World2D(BaseWorld):
         score = self.payoff_matrix[hider_index][seeker_index]
         return score
 
-    def generate_payoff_matrix(self):
-        """
-        Generate the game payoff matrix from the hider's perspective.
-        
-        Returns:
-            list: 2D list representing the payoff matrix
-        """
-        for i in range(self.size):
-            for j in range(self.size):
-                h_row, h_col = self.index_to_pos(i)
-                score = 1
-                if (i == j and self.human_choice == PlayerType.HIDER) or (i != j and self.human_choice == PlayerType.SEEKER):
-                    score *= -1
-                if i != j and self.places[h_row][h_col] == PlaceType.EASY:
-                    score *= 2
-                if i == j and self.places[h_row][h_col] == PlaceType.HARD:
-                    score *= 3
-                if self.use_proximity:
-                    score = self.apply_proximity_score(score, i, j)
-                self.payoff_matrix[i][j] = score
-
     def get_payoff_matrix(self):
         """
         Get the payoff matrix.